@@ -7,6 +7,8 @@ Auto-cleanup runs on every save, but this provides visibility and control.
 """
 
 import json
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from email_orchestrator.tools.history_manager import HistoryManager
 from email_orchestrator.tools.campaign_plan_manager import CampaignPlanManager
@@ -22,7 +24,7 @@ def show_file_stats():
     
     files = {
         "email_history_log.json": "Email History",
-        "campaign_plans.json": "Campaign Plans",
+        "campaign_plans.db": "Campaign Plans",
         "brand_bio_db.json": "Brand Bios"
     }
     
@@ -33,8 +35,12 @@ def show_file_stats():
             
             # Count entries
             try:
-                data = json.loads(path.read_text())
-                count = len(data) if isinstance(data, list) else len(data.keys())
+                if path.suffix == ".db":
+                    with closing(sqlite3.connect(str(path))) as conn:
+                        count = conn.execute("SELECT COUNT(*) FROM plans").fetchone()[0]
+                else:
+                    data = json.loads(path.read_text())
+                    count = len(data) if isinstance(data, list) else len(data.keys())
             except:
                 count = "?"
             
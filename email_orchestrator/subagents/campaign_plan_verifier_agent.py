@@ -59,8 +59,7 @@ async def campaign_plan_verifier_agent(
     # 5. Parse
     try:
         cleaned_json = _clean_json_string(result_json_str)
-        data = json.loads(cleaned_json)
-        result = CampaignPlanVerification(**data)
+        result = CampaignPlanVerification.model_validate_json(cleaned_json)
         
         if result.approved:
             print(f"[Campaign Plan Verifier] ✅ APPROVED: {result.final_verdict}")
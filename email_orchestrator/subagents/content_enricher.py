@@ -2,12 +2,21 @@ import json
 from datetime import datetime
 from email_orchestrator.tools.straico_tool import get_client
 from email_orchestrator.config import MODEL_RESEARCHER
+from email_orchestrator.tools.llm_cache import AsyncResponseCache
+
+NO_STATS_FALLBACK = "No real-time stats found. Please use generic estimations based on Brand Bio."
+NO_REVIEWS_FALLBACK = "No specific reviews found. Please use a generic placeholder."
+
+# Stats/reviews about a brand don't change between slots or back-to-back campaigns
+RESEARCH_CACHE_TTL_SECONDS = 6 * 3600
 
 class ContentEnricher:
     """
     Uses Perplexity (Online LLM) to find real-world data (Stats, Reviews) 
     to support specific email structures.
+    Successful lookups are cached per (brand, product context) across instances.
     """
+    _research_cache = AsyncResponseCache(ttl_seconds=RESEARCH_CACHE_TTL_SECONDS)
     
     def __init__(self):
         self.client = get_client()
@@ -18,6 +27,13 @@ class ContentEnricher:
         Finds quantitative statistics for the brand.
         Returns a formatted string list of stats.
         """
+        return await self._research_cache.get_or_call(
+            ("stats", self.model, brand_name, product_context),
+            lambda: self._find_stats(brand_name, product_context),
+            cache_if=lambda result: result != NO_STATS_FALLBACK
+        )
+
+    async def _find_stats(self, brand_name: str, product_context: str) -> str:
         print(f"[ContentEnricher] Hunting for STATS for {brand_name}...")
         
         prompt = f"""
@@ -59,12 +75,19 @@ class ContentEnricher:
             except Exception as e:
                 print(f"[ContentEnricher] Stats lookup attempt {attempt+1} failed: {e}")
         
-        return "No real-time stats found. Please use generic estimations based on Brand Bio."
+        return NO_STATS_FALLBACK
 
     async def find_reviews(self, brand_name: str, product_context: str) -> str:
         """
         Finds authentic reviews/testimonials.
         """
+        return await self._research_cache.get_or_call(
+            ("reviews", self.model, brand_name, product_context),
+            lambda: self._find_reviews(brand_name, product_context),
+            cache_if=lambda result: result != NO_REVIEWS_FALLBACK
+        )
+
+    async def _find_reviews(self, brand_name: str, product_context: str) -> str:
         print(f"[ContentEnricher] Hunting for REVIEWS for {brand_name}...")
         
         prompt = f"""
@@ -109,4 +132,4 @@ class ContentEnricher:
             except Exception as e:
                 print(f"[ContentEnricher] Reviews lookup attempt {attempt+1} failed. Error: {e}")
                 
-        return "No specific reviews found. Please use a generic placeholder."
+        return NO_REVIEWS_FALLBACK
@@ -283,9 +283,7 @@ def _parse_draft_response(result_json_str: str) -> EmailDraft:
     """Shared parsing logic."""
     try:
         cleaned_json = _clean_json_string(result_json_str)
-        data = json.loads(cleaned_json)
-        
-        draft = EmailDraft(**data)
+        draft = EmailDraft.model_validate_json(cleaned_json)
         draft.full_text_formatted = draft.to_formatted_text()
         
         print(f"[Drafter] Draft created: {draft.subject}")
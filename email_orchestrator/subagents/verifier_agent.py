@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from typing import Dict, Any, Tuple
 
@@ -61,8 +60,7 @@ async def verifier_agent(
     # 5. Parse
     try:
         cleaned_json = _clean_json_string(result_json_str)
-        data = json.loads(cleaned_json)
-        result = EmailVerification(**data)
+        result = EmailVerification.model_validate_json(cleaned_json)
         
         if result.approved:
             print(f"[Verifier] APPROVED (Score: {result.score}/10)")
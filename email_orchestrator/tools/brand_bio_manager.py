@@ -66,9 +66,8 @@ class BrandBioManager:
             fpath = os.path.join(self.catalog_dir, fname)
             if os.path.exists(fpath):
                 try:
-                    with open(fpath, 'r') as f:
-                        data = json.load(f)
-                        return BrandBio(**data)
+                    with open(fpath, 'rb') as f:
+                        return BrandBio.model_validate_json(f.read())
                 except Exception as e:
                     print(f"[BrandBioManager] Error reading {fpath}: {e}")
 
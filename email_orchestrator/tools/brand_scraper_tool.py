@@ -2,6 +2,7 @@ import json
 from typing import Optional
 from email_orchestrator.subagents.brand_scraper_agent import brand_scraper_agent
 from email_orchestrator.tools.brand_bio_manager import BrandBioManager
+from email_orchestrator.tools import fast_json
 
 async def analyze_brand(brand_name: Optional[str] = None, website_url: Optional[str] = None) -> str:
     """
@@ -52,7 +53,7 @@ async def analyze_brand(brand_name: Optional[str] = None, website_url: Optional[
         # Cache it
         try:
             from email_orchestrator.schemas import BrandBio
-            bio_data = json.loads(bio_json)
+            bio_data = fast_json.loads(bio_json)
             
             # Check for scraper error return
             if "error" in bio_data:
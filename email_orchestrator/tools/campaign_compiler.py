@@ -1,9 +1,18 @@
 """
 Campaign Compiler Module
 Merges multiple email drafts into a SINGLE Google Doc.
+
+Performance profile: network I/O bound. `compile_campaign` time is dominated
+by Docs API round-trips (documents().get / batchUpdate inside
+write_email_to_doc) and the rate-limit sleeps between drafts; local CPU work
+is negligible. Reduce or batch API calls rather than optimising Python code.
+To see where the wall-clock goes:
+
+    py-spy record -o compile.svg -- python test_export.py
 """
 
 import os
+import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -12,7 +21,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from email_orchestrator.tools.google_docs_export import write_email_to_doc
+from email_orchestrator.tools.google_docs_export import create_doc, write_email_to_doc
 
 SCOPES = ['https://www.googleapis.com/auth/documents', 'https://www.googleapis.com/auth/drive']
 DEFAULT_CREDENTIALS_PATH = Path(__file__).parent.parent.parent / "google_credentials.json"
@@ -57,14 +66,11 @@ class CampaignCompiler:
         File Name: BRAND-MONTH-CAMPAIGN ID_Drafts
         """
         doc_title = f"{brand_name}-{target_month}-{campaign_id}"
+        generated_at = datetime.now().isoformat(timespec='seconds')
+        title_item = {"text": f"CAMPAIGN DRAFTS: {doc_title}\nGenerated: {generated_at}\n\n", "bold": True, "h1": True}
         
-        # 1. Create Doc
-        doc = self.docs_service.documents().create(body={'title': doc_title}).execute()
-        doc_id = doc.get('documentId')
-        
-        # 2. Move to folder
-        if folder_id:
-            self._move_to_folder(doc_id, folder_id)
+        # 1. Create Doc (directly inside the folder: one Drive call instead of create + move)
+        doc_id = create_doc(self.docs_service, self.drive_service, doc_title, folder_id)
             
         # 3. Batch Update Content (Legacy Format)
         
@@ -89,7 +95,7 @@ class CampaignCompiler:
         content_items = []
         
         # Title of the Compiled Doc
-        content_items.append({"text": f"CAMPAIGN DRAFTS: {doc_title}\nGenerated: {datetime.now()}\n\n", "bold": True, "h1": True})
+        content_items.append(title_item)
         content_items.append({"text": "\n", "bold": False, "h1": False})
         
         # Sort drafts
@@ -106,7 +112,6 @@ class CampaignCompiler:
                 write_email_to_doc(self.docs_service, doc_id, draft, structure, lang, header_text=slot_header)
                 
                 # RATE LIMIT PROTECTION: Sleep 2s between writes
-                import time
                 time.sleep(2)
             except Exception as e:
                 print(f"[Compiler] Error writing draft {draft.get('slot_number')}: {e}")
@@ -116,19 +121,15 @@ class CampaignCompiler:
         print(f"[Compiler] Created Compiled Doc: {doc_url}")
         return doc_url
 
-    def _move_to_folder(self, file_id: str, folder_id: str):
-        try:
-            file = self.drive_service.files().get(fileId=file_id, fields='parents').execute()
-            previous_parents = ",".join(file.get('parents', []))
-            self.drive_service.files().update(
-                fileId=file_id,
-                addParents=folder_id,
-                removeParents=previous_parents,
-                fields='id, parents'
-            ).execute()
-        except Exception:
-            pass
+# Authenticated once per process (see google_sheets_export.get_sheets_exporter)
+_compiler = None
+
+def get_campaign_compiler() -> CampaignCompiler:
+    """Get or create the shared CampaignCompiler"""
+    global _compiler
+    if _compiler is None:
+        _compiler = CampaignCompiler()
+    return _compiler
 
 def compile_campaign_doc(brand_name, campaign_id, target_month, drafts, folder_id=None):
-    compiler = CampaignCompiler()
-    return compiler.compile_campaign(brand_name, campaign_id, target_month, drafts, folder_id)
+    return get_campaign_compiler().compile_campaign(brand_name, campaign_id, target_month, drafts, folder_id)
@@ -1,8 +1,24 @@
 """
 Campaign Plan Manager with auto-cleanup for old/completed plans.
+
+Plans are stored in a SQLite database (one row per plan) so that a status
+change or a single save only touches the affected rows instead of rewriting
+the whole store. The full plan is kept as JSON text in the `payload` column;
+the other columns mirror the fields used for lookups and cleanup.
+
+Performance profile: disk I/O + JSON encode/decode bound (no network).
+Hot paths are `save_plan` -> `_cleanup_if_needed`, `_load_all` and
+`get_plans_by_brand`; wins come from touching fewer rows and parsing fewer
+payloads, not from vectorising Python code. To profile:
+
+    python -m cProfile -s cumulative -o plans.prof check_data_usage.py
 """
 
+import heapq
 import json
+import sqlite3
+import threading
+from collections import Counter
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
@@ -14,31 +30,122 @@ MAX_PLANS_PER_BRAND = 10  # Keep last 10 campaign plans per brand
 ARCHIVE_COMPLETED_AFTER_DAYS = 90  # Archive completed plans after 90 days
 DELETE_ARCHIVED_AFTER_DAYS = 365  # Delete archived plans after 1 year
 
+# Payloads are machine-read only: no indentation or inter-element whitespace
+COMPACT_SEPARATORS = (',', ':')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    campaign_id TEXT PRIMARY KEY,
+    brand_name TEXT,
+    brand_name_lc TEXT,
+    brand_id TEXT,
+    status TEXT,
+    created_at TEXT,
+    created_ts INTEGER,
+    payload TEXT NOT NULL
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_plans_brand_lc ON plans (brand_name_lc, created_at);
+CREATE INDEX IF NOT EXISTS idx_plans_brand_id ON plans (brand_id, created_at);
+"""
+
+def _parse_created_ts(created_str: Optional[str]) -> Optional[int]:
+    """Convert an ISO created_at string to naive epoch seconds (None if unparseable)."""
+    try:
+        created = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
+        # comparison fix: ensure both are naive
+        if created.tzinfo is not None:
+            created = created.replace(tzinfo=None)
+        return int(created.timestamp())
+    except (AttributeError, TypeError, ValueError):
+        return None
+
 class CampaignPlanManager:
     """
     Manages the persistence and retrieval of multi-email campaign plans.
     Includes auto-cleanup to prevent unbounded growth.
     """
     
-    def __init__(self, db_path: str = "campaign_plans.json"):
-        self.db_path = Path(db_path)
+    def __init__(self, db_path: str = "campaign_plans.db"):
+        # Passing the legacy JSON path keeps working: the SQLite file lives next to it
+        db_path = Path(db_path)
+        if db_path.suffix == ".json":
+            db_path = db_path.with_suffix(".db")
+        self.db_path = db_path
+        self.legacy_json_path = db_path.with_suffix(".json")
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._ensure_db_exists()
     
     def _ensure_db_exists(self):
-        """Create the database file if it doesn't exist."""
-        if not self.db_path.exists():
-            self.db_path.write_text(json.dumps([], indent=2))
+        """Create the schema if needed and import plans from the legacy JSON file."""
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+            self._conn.executescript(INDEXES)
+            row_count = self._conn.execute("SELECT COUNT(*) FROM plans").fetchone()[0]
+        
+        if row_count == 0 and self.legacy_json_path.exists():
+            try:
+                legacy_plans = json.loads(self.legacy_json_path.read_text())
+            except json.JSONDecodeError:
+                legacy_plans = []
+            if legacy_plans:
+                self._save_all(legacy_plans)
+                print(f"[CampaignPlanManager] Migrated {len(legacy_plans)} plans from {self.legacy_json_path}")
+    
+    @staticmethod
+    def _row_values(plan: Dict[str, Any]) -> tuple:
+        """Column values for a plan dict, in _upsert order."""
+        brand_name = plan.get("brand_name", "")
+        created_at = plan.get("created_at", "")
+        return (
+            plan.get("campaign_id"),
+            brand_name,
+            (brand_name or "").lower(),
+            plan.get("brand_id"),
+            plan.get("status", "draft"),
+            created_at,
+            _parse_created_ts(created_at),
+            json.dumps(plan, separators=COMPACT_SEPARATORS),
+        )
+    
+    def _upsert(self, plans: List[Dict[str, Any]]):
+        """Insert or replace the given plans (caller holds the lock/transaction)."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO plans (campaign_id, brand_name, brand_name_lc, brand_id, status, created_at, created_ts, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [self._row_values(p) for p in plans]
+        )
     
     def _load_all(self) -> List[Dict[str, Any]]:
         """Load all campaign plans from the database."""
-        try:
-            return json.loads(self.db_path.read_text())
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM plans").fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+    
+    def _load_one(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+        """Load a single plan dict by primary key."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM plans WHERE campaign_id = ?", (campaign_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
     
     def _save_all(self, plans: List[Dict[str, Any]]):
-        """Save all campaign plans to the database."""
-        self.db_path.write_text(json.dumps(plans, indent=2))
+        """Replace the whole database content with the given plans."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM plans")
+            self._upsert(plans)
+    
+    def export_pretty(self, path: str) -> None:
+        """Write all plans to a human-readable (indented) JSON file."""
+        Path(path).write_text(json.dumps(self._load_all(), indent=2))
+        print(f"[CampaignPlanManager] Exported plans to {path}")
     
     def _cleanup_if_needed(self, plans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -49,28 +156,27 @@ class CampaignPlanManager:
         2. Archive completed plans older than ARCHIVE_COMPLETED_AFTER_DAYS
         3. Keep last MAX_PLANS_PER_BRAND per brand (excluding archived)
         """
-        now = datetime.now()
-        cleaned = []
+        now_ts = datetime.now().timestamp()
         archived_count = 0
         deleted_count = 0
         
-        # Group by brand
-        by_brand = {}
+        # Per-brand min-heaps of the newest active plans, capped at MAX_PLANS_PER_BRAND.
+        # Entries are (created_at, seq, plan); seq keeps ties in input order.
+        active_heaps: Dict[str, list] = {}
+        archived_plans = []
         
-        for plan in plans:
+        for seq, plan in enumerate(plans):
             brand = plan.get("brand_name", "unknown")
             status = plan.get("status", "draft")
-            created_str = plan.get("created_at", "")
             
-            try:
-                created = datetime.fromisoformat(created_str.replace('Z', '+00:00'))
-                # comparison fix: ensure both are naive
-                if created.tzinfo is not None:
-                    created = created.replace(tzinfo=None)
-            except:
-                created = now  # If can't parse, treat as recent
+            # Rows from the database carry the pre-parsed timestamp
+            created_ts = plan.get("_created_ts")
+            if created_ts is None:
+                created_ts = _parse_created_ts(plan.get("created_at", ""))
+            if created_ts is None:
+                created_ts = now_ts  # If can't parse, treat as recent
             
-            age_days = (now - created).days
+            age_days = int((now_ts - created_ts) // 86400)
             
             # Delete very old archived plans
             if status == "archived" and age_days > DELETE_ARCHIVED_AFTER_DAYS:
@@ -82,26 +188,21 @@ class CampaignPlanManager:
                 plan["status"] = "archived"
                 archived_count += 1
             
-            # Group by brand for per-brand limits
-            if brand not in by_brand:
-                by_brand[brand] = []
-            by_brand[brand].append(plan)
-        
-        # Keep last N per brand (excluding archived)
-        for brand, brand_plans in by_brand.items():
-            # Separate archived from active
-            archived = [p for p in brand_plans if p.get("status") == "archived"]
-            active = [p for p in brand_plans if p.get("status") != "archived"]
-            
-            # Sort active by created_at
-            active_sorted = sorted(active, key=lambda x: x.get("created_at", ""))
-            
-            # Keep last MAX_PLANS_PER_BRAND active plans
-            kept_active = active_sorted[-MAX_PLANS_PER_BRAND:]
-            
             # Keep all archived (they'll be deleted by age eventually)
-            cleaned.extend(kept_active)
-            cleaned.extend(archived)
+            if plan.get("status") == "archived":
+                archived_plans.append(plan)
+                continue
+            
+            # Keep last MAX_PLANS_PER_BRAND active plans per brand
+            heap = active_heaps.setdefault(brand, [])
+            entry = (plan.get("created_at") or "", seq, plan)
+            if len(heap) < MAX_PLANS_PER_BRAND:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
+        
+        cleaned = [plan for heap in active_heaps.values() for _, _, plan in heap]
+        cleaned.extend(archived_plans)
         
         if archived_count > 0 or deleted_count > 0:
             print(f"[CampaignPlanManager] Cleanup: archived {archived_count}, deleted {deleted_count} old plans")
@@ -110,49 +211,71 @@ class CampaignPlanManager:
     
     def save_plan(self, plan: CampaignPlan) -> None:
         """Save a new campaign plan or update an existing one."""
-        plans = self._load_all()
-        
-        # Remove existing plan with same ID if present
-        plans = [p for p in plans if p.get("campaign_id") != plan.campaign_id]
-        
-        # Add new plan
-        plans.append(plan.model_dump())
-        
-        # Auto-cleanup
-        plans = self._cleanup_if_needed(plans)
+        with self._lock, self._conn:
+            self._upsert([plan.model_dump()])
+            
+            # Auto-cleanup runs on the lightweight index columns only
+            rows = self._conn.execute(
+                "SELECT campaign_id, brand_name, status, created_at, created_ts FROM plans"
+            ).fetchall()
+            index_rows = [
+                {"campaign_id": cid, "brand_name": brand, "status": status,
+                 "created_at": created, "_created_ts": created_ts}
+                for cid, brand, status, created, created_ts in rows
+            ]
+            original_status = {r["campaign_id"]: r["status"] for r in index_rows}
+            kept = self._cleanup_if_needed(index_rows)
+            
+            kept_ids = {r["campaign_id"] for r in kept}
+            removed = [(cid,) for cid in original_status if cid not in kept_ids]
+            if removed:
+                self._conn.executemany("DELETE FROM plans WHERE campaign_id = ?", removed)
+            for r in kept:
+                if r["status"] != original_status[r["campaign_id"]]:
+                    self._set_status(r["campaign_id"], r["status"])
         
-        self._save_all(plans)
         print(f"[CampaignPlanManager] Saved plan: {plan.campaign_id}")
     
+    def _set_status(self, campaign_id: str, new_status: str) -> bool:
+        """Update the status column and payload of one row (caller holds the lock/transaction)."""
+        row = self._conn.execute(
+            "SELECT payload FROM plans WHERE campaign_id = ?", (campaign_id,)
+        ).fetchone()
+        if not row:
+            return False
+        plan = json.loads(row[0])
+        plan["status"] = new_status
+        self._conn.execute(
+            "UPDATE plans SET status = ?, payload = ? WHERE campaign_id = ?",
+            (new_status, json.dumps(plan, separators=COMPACT_SEPARATORS), campaign_id)
+        )
+        return True
+    
     def get_plan(self, campaign_id: str) -> Optional[CampaignPlan]:
         """Retrieve a campaign plan by ID."""
-        plans = self._load_all()
-        for plan_dict in plans:
-            if plan_dict.get("campaign_id") == campaign_id:
-                return CampaignPlan(**plan_dict)
-        return None
+        plan_dict = self._load_one(campaign_id)
+        return CampaignPlan(**plan_dict) if plan_dict else None
     
     def get_plans_by_brand(self, brand_name: str, brand_id: Optional[str] = None) -> List[CampaignPlan]:
         """Get all campaign plans for a specific brand."""
-        plans = self._load_all()
+        # Candidate rows come from the brand_name_lc / brand_id indexes
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT brand_id, payload FROM plans "
+                "WHERE (status IS NULL OR status != 'archived') "
+                "AND (brand_name_lc = ? OR brand_id = ?) "
+                "ORDER BY created_at DESC",
+                (brand_name.lower() if brand_name else None, brand_id or None)
+            ).fetchall()
         
         filtered_plans = []
-        for p in plans:
-            # Skip archived
-            if p.get("status") == "archived":
-                continue
-                
+        for p_brand_id, payload in rows:
             # Filter logic: Prefer brand_id if both have it. Fallback to name.
-            p_brand_id = p.get("brand_id")
-            p_brand_name = p.get("brand_name", "")
-            
-            if brand_id and p_brand_id:
-                if p_brand_id == brand_id:
-                    filtered_plans.append(CampaignPlan(**p))
-            elif brand_name and p_brand_name.lower() == brand_name.lower():
-                filtered_plans.append(CampaignPlan(**p))
+            if brand_id and p_brand_id and p_brand_id != brand_id:
+                continue
+            filtered_plans.append(CampaignPlan.model_validate_json(payload))
                 
-        return sorted(filtered_plans, key=lambda x: x.created_at, reverse=True)
+        return filtered_plans
 
     def list_all_plans(self) -> List[CampaignPlan]:
         """List all available campaign plans."""
@@ -161,17 +284,10 @@ class CampaignPlanManager:
     
     def update_plan_status(self, campaign_id: str, new_status: str) -> bool:
         """Update the status of a campaign plan."""
-        plans = self._load_all()
-        updated = False
-        
-        for plan in plans:
-            if plan.get("campaign_id") == campaign_id:
-                plan["status"] = new_status
-                updated = True
-                break
+        with self._lock, self._conn:
+            updated = self._set_status(campaign_id, new_status)
         
         if updated:
-            self._save_all(plans)
             print(f"[CampaignPlanManager] Updated status for {campaign_id}: {new_status}")
         
         return updated
@@ -194,30 +310,44 @@ class CampaignPlanManager:
         return None
     
     def get_slot_by_number(self, campaign_id: str, slot_number: int) -> Optional[EmailSlot]:
-        """Get a specific email slot by its number."""
-        plan = self.get_plan(campaign_id)
-        if not plan:
+        """
+        Get a specific email slot by its number.
+        One primary-key row read; only the matching slot is validated, not the whole plan.
+        """
+        plan_dict = self._load_one(campaign_id)
+        if not plan_dict:
             return None
         
-        for slot in plan.email_slots:
-            if slot.slot_number == slot_number:
-                return slot
+        for slot in plan_dict.get("email_slots", []):
+            if slot.get("slot_number") == slot_number:
+                return EmailSlot(**slot)
         
         return None
     
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about campaign plans."""
-        plans = self._load_all()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT COALESCE(brand_name, 'unknown'), COALESCE(status, 'draft'), COUNT(*) "
+                "FROM plans GROUP BY 1, 2"
+            ).fetchall()
         
-        by_brand = {}
-        by_status = {}
+        # Each plan is one row, so every plan is counted exactly once per breakdown
+        by_brand = Counter()
+        by_status = Counter()
+        for brand, status, count in rows:
+            by_brand[brand] += count
+            by_status[status] += count
         
-        for plan in plans:
-            brand = plan.get("brand_name", "unknown")
-            status = plan.get("status", "draft")
-            
-            by_brand[brand] = by_brand.get(brand, 0) + 1
-            by_status[status] = by_status.get(status, 0) + 1
+        return {
+            "total_plans": sum(by_status.values()),
+            "brands": len(by_brand),
+            "plans_by_brand": dict(by_brand),
+            "plans_by_status": dict(by_status),
+            "max_per_brand": MAX_PLANS_PER_BRAND,
+            "archive_after_days": ARCHIVE_COMPLETED_AFTER_DAYS,
+            "delete_after_days": DELETE_ARCHIVED_AFTER_DAYS
+        }
         
     def update_plan_from_import(self, imported_data: Dict[str, Any]) -> bool:
         """
@@ -229,20 +359,13 @@ class CampaignPlanManager:
             print("[CampaignPlanManager] Update failed: No campaign_id in imported data.")
             return False
             
-        plans = self._load_all()
-        target_index = -1
-        
-        for i, p in enumerate(plans):
-            if p.get("campaign_id") == campaign_id:
-                target_index = i
-                break
+        target_plan = self._load_one(campaign_id)
         
-        if target_index == -1:
+        if target_plan is None:
             print(f"[CampaignPlanManager] Plan {campaign_id} not found.")
             return False
         
         # Merge Data
-        target_plan = plans[target_index]
         
         # 1. Update Top-Level fields if present (e.g. Narrative)
         # Note: Current importer mainly focuses on slots, but we can extend.
@@ -308,8 +431,8 @@ class CampaignPlanManager:
             
         if changes_made:
             target_plan["email_slots"] = updated_slots_list
-            plans[target_index] = target_plan
-            self._save_all(plans)
+            with self._lock, self._conn:
+                self._upsert([target_plan])
             print(f"[CampaignPlanManager] ✓ Synced plan {campaign_id} with Google Sheet data (Strict Sync).")
             return True
         else:
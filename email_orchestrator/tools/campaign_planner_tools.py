@@ -3,23 +3,53 @@ Helper tools for the Campaign Planner ADK Agent.
 These tools provide contextual suggestions for strategic content selection.
 """
 
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Optional, Tuple
 from email_orchestrator.tools.knowledge_reader import KnowledgeReader
 from email_orchestrator.tools.history_manager import HistoryManager
+from email_orchestrator.tools import fast_json
 
 from email_orchestrator.tools.straico_tool import get_client
 from email_orchestrator.config import STRAICO_MODEL
 from pathlib import Path
 from email_orchestrator.schemas import CampaignPlan, BrandBio
 import asyncio
+import functools
+import re
+from collections import Counter
 
 # Initialize tools
 knowledge_reader = KnowledgeReader()
 history_manager = HistoryManager()
 
+# Max slots brainstormed/judged at the same time in optimize_plan_transformations
+MAX_CONCURRENT_SLOT_OPTIMIZATIONS = 5
+
+@functools.lru_cache(maxsize=8)
+def load_planner_prompt(filename: str) -> str:
+    """Load a campaign planner prompt template (read once per process)."""
+    prompt_path = Path(__file__).parent.parent / "prompts" / "campaign_planner" / filename
+    return prompt_path.read_text(encoding="utf-8")
+
+# Truncated knowledge-base excerpts, keyed by (filename, length)
+_EXCERPTS: Dict[Tuple[str, int], str] = {}
+
+def _excerpt(filename: str, length: int) -> str:
+    """First `length` chars of a knowledge PDF. Failed reads ("") are not cached."""
+    key = (filename, length)
+    if key not in _EXCERPTS:
+        content = knowledge_reader.get_document_content(filename)
+        if not content:
+            return ""
+        _EXCERPTS[key] = content[:length]
+    return _EXCERPTS[key]
+
+def _recently_used(brand_name: str, limit: int, field: str) -> List[str]:
+    """Non-empty values of one CampaignLogEntry field across the brand's recent history."""
+    values = history_manager.get_recent_fields(brand_name, limit, (field,))[field]
+    return [v for v in values if v]
+
 async def brainstorm_transformations(
-    brand_bio: BrandBio,
+    brand_bio_json: str,
     campaign_goal: str,
     product: str,
     purpose: str,
@@ -28,16 +58,15 @@ async def brainstorm_transformations(
 ) -> List[Dict]:
     """
     Agent A: Generates 3 transformation options.
+    `brand_bio_json` is the pre-serialized BrandBio (serialize once per plan).
     """
-    prompt_path = Path(__file__).parent.parent / "prompts" / "campaign_planner" / "transformation_brainstormer.txt"
-    template = prompt_path.read_text(encoding="utf-8")
+    template = load_planner_prompt("transformation_brainstormer.txt")
     
     # Get catalog sample
-    catalog_content = knowledge_reader.get_document_content("Transformations v2.pdf")
-    catalog_sample = catalog_content[:1500] # Truncate for token efficiency
+    catalog_sample = _excerpt("Transformations v2.pdf", 1500) # Truncate for token efficiency
 
     full_prompt = template.format(
-        brand_bio=brand_bio.model_dump_json(),
+        brand_bio=brand_bio_json,
         campaign_goal=campaign_goal,
         product=product,
         purpose=purpose,
@@ -53,28 +82,28 @@ async def brainstorm_transformations(
         response = await client.generate_text(full_prompt, model=STRAICO_MODEL)
         # Parse JSON
         cleaned = _clean_json_string(response)
-        data = json.loads(cleaned)
+        data = fast_json.loads(cleaned)
         return data.get("options", [])
     except Exception as e:
         print(f"[Brainstormer] Error: {e}")
         return []
 
 async def select_best_transformation(
-    brand_bio: BrandBio,
+    brand_bio_json: str,
     campaign_goal: str,
     options: List[Dict],
     language: str = "FR"
 ) -> Dict:
     """
     Agent B: Selects the best transformation.
+    `brand_bio_json` is the pre-serialized BrandBio (serialize once per plan).
     """
-    prompt_path = Path(__file__).parent.parent / "prompts" / "campaign_planner" / "transformation_judge.txt"
-    template = prompt_path.read_text(encoding="utf-8")
+    template = load_planner_prompt("transformation_judge.txt")
     
     full_prompt = template.format(
-        brand_bio=brand_bio.model_dump_json(),
+        brand_bio=brand_bio_json,
         campaign_goal=campaign_goal,
-        options_json=json.dumps(options, indent=2)
+        options_json=fast_json.dumps(options, indent=True)
     )
     
     # Appending language instruction
@@ -84,7 +113,7 @@ async def select_best_transformation(
     try:
         response = await client.generate_text(full_prompt, model=STRAICO_MODEL)
         cleaned = _clean_json_string(response)
-        return json.loads(cleaned)
+        return fast_json.loads(cleaned)
     except Exception as e:
         print(f"[Judge] Error: {e}")
         return {}
@@ -102,53 +131,66 @@ async def optimize_plan_transformations(
     target_lang = plan.languages[0] if plan.languages else "FR"
     print(f"[Optimization] Target Language detected: {target_lang}")
     
-    for slot in plan.email_slots:
-        print(f" - [Slot {slot.slot_number}] Brainstorming...")
-        
-        # 1. Brainstorm
-        options = await brainstorm_transformations(
-            brand_bio=brand_bio,
-            campaign_goal=plan.campaign_goal,
-            product=slot.offer_details or slot.key_message or "General Brand Products",
-            purpose=slot.email_purpose,
-            structure=slot.structure_id,
-            language=target_lang
-        )
-        
-        if not options:
-            print(f"   [Warning] Brainstorming failed for Slot {slot.slot_number}. Keeping original.")
-            continue
+    # Same brand for every slot: serialize once instead of twice per slot
+    brand_bio_json = brand_bio.model_dump_json()
+    
+    # Slots are independent: run them concurrently, capped to spare the Straico API
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLOT_OPTIMIZATIONS)
+    
+    async def _optimize_slot(slot) -> Optional[Dict]:
+        async with semaphore:
+            print(f" - [Slot {slot.slot_number}] Brainstorming...")
             
-        # 2. Judge
-        print(f"   - [Slot {slot.slot_number}] Judging {len(options)} options...")
-        verdict = await select_best_transformation(brand_bio, plan.campaign_goal, options, language=target_lang)
-        
-        if verdict and verdict.get("final_refined_transformation"):
-            # 3. Apply
+            # 1. Brainstorm
+            options = await brainstorm_transformations(
+                brand_bio_json=brand_bio_json,
+                campaign_goal=plan.campaign_goal,
+                product=slot.offer_details or slot.key_message or "General Brand Products",
+                purpose=slot.email_purpose,
+                structure=slot.structure_id,
+                language=target_lang
+            )
+            
+            if not options:
+                print(f"   [Warning] Brainstorming failed for Slot {slot.slot_number}. Keeping original.")
+                return None
+                
+            # 2. Judge
+            print(f"   - [Slot {slot.slot_number}] Judging {len(options)} options...")
+            return await select_best_transformation(brand_bio_json, plan.campaign_goal, options, language=target_lang)
+    
+    verdicts = await asyncio.gather(
+        *[_optimize_slot(slot) for slot in plan.email_slots],
+        return_exceptions=True
+    )
+    
+    # 3. Apply (in slot order)
+    for slot, verdict in zip(plan.email_slots, verdicts):
+        if isinstance(verdict, Exception):
+            print(f"   [Warning] Optimization failed for Slot {slot.slot_number} ({verdict}). Keeping original.")
+        elif verdict and verdict.get("final_refined_transformation"):
             new_trans = verdict["final_refined_transformation"]
             rationale = verdict.get("rationale", "N/A")
-            print(f"   => WINNER: {new_trans}")
+            print(f"   => [Slot {slot.slot_number}] WINNER: {new_trans}")
             print(f"      (Rationale: {rationale})")
             
             slot.transformation_description = new_trans
-        else:
+        elif verdict is not None:
             print(f"   [Warning] Judging failed for Slot {slot.slot_number}. Keeping original.")
 
     return plan
 
+_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
 def _clean_json_string(raw_text: str) -> str:
     """Helper for JSON cleanup"""
-    text = raw_text.strip()
-    if "```json" in text:
-        text = text.split("```json")[1].split("```")[0]
-    elif "```" in text:
-        text = text.split("```")[1].split("```")[0]
-    text = text.strip()
-    if "{" in text:
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        return text[start:end]
-    return text
+    match = _FENCE_RE.search(raw_text)
+    text = match.group(1) if match else raw_text
+    start = text.find("{")
+    end = text.rfind("}")
+    if start >= 0 and end > start:
+        return text[start:end + 1]
+    return text.strip()
 
 
 def get_transformation_options(
@@ -169,20 +211,18 @@ def get_transformation_options(
         JSON string with transformation options and recommendations
     """
     # Get transformations from knowledge base
-    transformations_content = knowledge_reader.get_document_content("Transformations v2.pdf")
+    transformations_content = _excerpt("Transformations v2.pdf", 2000)  # Truncate for context
     
     # Get recent history
-    recent_history = history_manager.get_recent_campaigns(brand_name, limit=10) if exclude_recent else []
-    used_transformations = [entry.transformation_used for entry in recent_history]
+    used_transformations = _recently_used(brand_name, 10, "transformation_description") if exclude_recent else []
     
     result = {
-        "available_transformations": transformations_content[:2000],  # Truncate for context
+        "available_transformations": transformations_content,
         "recently_used": used_transformations,
         "recommendation": f"Choose transformations that align with '{campaign_goal}' and avoid: {', '.join(used_transformations[:5])}"
     }
     
-    import json
-    return json.dumps(result, indent=2)
+    return fast_json.dumps(result, indent=True)
 
 def get_storytelling_angle_options(
     brand_name: str,
@@ -201,20 +241,18 @@ def get_storytelling_angle_options(
         JSON string with storytelling angle options
     """
     # Get storytelling angles from knowledge base
-    storytelling_content = knowledge_reader.get_document_content("Storytelling.pdf")
+    storytelling_content = _excerpt("Storytelling.pdf", 2000)
     
     # Get recent history
-    recent_history = history_manager.get_recent_campaigns(brand_name, limit=10) if exclude_recent else []
-    used_angles = [entry.storytelling_angle_used for entry in recent_history]
+    used_angles = _recently_used(brand_name, 10, "angle_description") if exclude_recent else []
     
     result = {
-        "available_angles": storytelling_content[:2000],
+        "available_angles": storytelling_content,
         "recently_used": used_angles,
         "recommendation": f"For {email_purpose} emails, choose angles that haven't been used recently: avoid {', '.join(used_angles[:5])}"
     }
     
-    import json
-    return json.dumps(result, indent=2)
+    return fast_json.dumps(result, indent=True)
 
 def get_structure_options(
     brand_name: str,
@@ -233,20 +271,18 @@ def get_structure_options(
         JSON string with structure options
     """
     # Get structures from knowledge base
-    structures_content = knowledge_reader.get_document_content("Email Descriptive Block Structures_ A Comprehensive Guide.pdf")
+    structures_content = _excerpt("Email Descriptive Block Structures_ A Comprehensive Guide.pdf", 2000)
     
     # Get recent history
-    recent_history = history_manager.get_recent_campaigns(brand_name, limit=5) if exclude_recent else []
-    used_structures = [entry.structure_used for entry in recent_history]
+    used_structures = _recently_used(brand_name, 5, "structure_id") if exclude_recent else []
     
     result = {
-        "available_structures": structures_content[:2000],
+        "available_structures": structures_content,
         "recently_used": used_structures,
         "recommendation": f"Choose a structure that fits '{transformation}' and avoid: {', '.join(used_structures)}"
     }
     
-    import json
-    return json.dumps(result, indent=2)
+    return fast_json.dumps(result, indent=True)
 
 def get_persona_options(
     brand_name: str,
@@ -263,15 +299,14 @@ def get_persona_options(
         JSON string with persona options
     """
     # Get personas from knowledge base
-    personas_content = knowledge_reader.get_document_content("Personas.pdf")
+    personas_content = _excerpt("Personas.pdf", 2000)
     
     result = {
-        "available_personas": personas_content[:2000],
+        "available_personas": personas_content,
         "recommendation": f"Choose personas that resonate with '{target_audience}'. Variety is good, but some repetition is acceptable."
     }
     
-    import json
-    return json.dumps(result, indent=2)
+    return fast_json.dumps(result, indent=True)
 
 def validate_campaign_variety(
     brand_name: str,
@@ -294,32 +329,28 @@ def validate_campaign_variety(
     
     issues = []
     
-    # Check for duplicates within the campaign
-    if len(transformations) != len(set(transformations)):
-        duplicates = [t for t in transformations if transformations.count(t) > 1]
-        issues.append(f"Duplicate transformations found: {set(duplicates)}")
+    # Unique values per field in slot order (dict as ordered set), reused below for history checks
+    unique_transformations = dict.fromkeys(transformations)
+    unique_angles = dict.fromkeys(angles)
     
-    if len(angles) != len(set(angles)):
-        duplicates = [a for a in angles if angles.count(a) > 1]
-        issues.append(f"Duplicate storytelling angles found: {set(duplicates)}")
-    
-    if len(structures) != len(set(structures)):
-        duplicates = [s for s in structures if structures.count(s) > 1]
-        issues.append(f"Duplicate structures found: {set(duplicates)}")
+    # Check for duplicates within the campaign. Counting only runs when the sizes differ.
+    for label, values, unique in (("transformations", transformations, unique_transformations),
+                                  ("storytelling angles", angles, unique_angles),
+                                  ("structures", structures, dict.fromkeys(structures))):
+        if len(unique) == len(values):
+            continue
+        duplicates = [v for v, n in Counter(values).items() if n > 1 and v is not None]
+        if duplicates:
+            issues.append(f"Duplicate {label} found: {set(duplicates)}")
     
     # Check against recent history
-    recent_history = history_manager.get_recent_campaigns(brand_name, limit=10)
-    recent_transformations = [entry.transformation_used for entry in recent_history]
-    recent_angles = [entry.storytelling_angle_used for entry in recent_history]
-    
-    history_conflicts = []
-    for t in transformations:
-        if t in recent_transformations:
-            history_conflicts.append(f"Transformation '{t}' was used recently")
+    recent = history_manager.get_recent_fields(brand_name, 10, ("transformation_description", "angle_description"))
+    recent_transformations = {t for t in recent["transformation_description"] if t}
+    recent_angles = {a for a in recent["angle_description"] if a}
     
-    for a in angles:
-        if a in recent_angles:
-            history_conflicts.append(f"Angle '{a}' was used recently")
+    # Each conflict is reported once, in slot order
+    history_conflicts = [f"Transformation '{t}' was used recently" for t in unique_transformations if t in recent_transformations]
+    history_conflicts += [f"Angle '{a}' was used recently" for a in unique_angles if a in recent_angles]
     
     result = {
         "valid": len(issues) == 0 and len(history_conflicts) == 0,
@@ -328,5 +359,4 @@ def validate_campaign_variety(
         "recommendation": "Fix all issues before finalizing the campaign plan" if issues or history_conflicts else "Variety looks good!"
     }
     
-    import json
-    return json.dumps(result, indent=2)
+    return fast_json.dumps(result, indent=True)
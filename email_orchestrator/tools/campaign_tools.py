@@ -1,6 +1,13 @@
-import json
-from datetime import datetime
-from typing import Optional, Dict, List
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Tuple
 
 from email_orchestrator.schemas import (
     BrandBio, CampaignPlan, CampaignRequest, EmailBlueprint, EmailDraft, 
@@ -18,21 +25,115 @@ from email_orchestrator.tools.campaign_planner_tools import optimize_plan_transf
 from email_orchestrator.subagents.verifier_agent import verifier_agent
 from email_orchestrator.tools.deterministic_verifier import DeterministicVerifier
 
-from email_orchestrator.tools.knowledge_reader import KnowledgeReader
 from email_orchestrator.tools.history_manager import HistoryManager
 from email_orchestrator.tools.campaign_plan_manager import CampaignPlanManager
-from email_orchestrator.tools.google_docs_export import export_email_to_google_docs
 from email_orchestrator.tools.token_tracker import get_token_tracker
+from email_orchestrator.tools import fast_json
+
+# Per-slot progress logging. Slots run concurrently, so records go through a queue and
+# are formatted/written by a single background listener instead of each coroutine
+# writing to stdout directly. Output format matches the plain print() lines.
+logger = logging.getLogger("campaign")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stdout_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Initialize Tools
-knowledge = KnowledgeReader()
 history_manager = HistoryManager()
-campaign_manager = CampaignPlanManager()
 det_verifier = DeterministicVerifier()
 
+# The plan store opens SQLite (and may migrate the legacy JSON) on construction,
+# so it is created on first use rather than on import.
+_campaign_manager = None
+
+def get_campaign_manager() -> CampaignPlanManager:
+    """Get or create the shared CampaignPlanManager"""
+    global _campaign_manager
+    if _campaign_manager is None:
+        _campaign_manager = CampaignPlanManager()
+    return _campaign_manager
+
 # Default folder from User Feedback
 POPBRUSH_FOLDER_ID = "1pAK5hmb2Kvn2KUOwxXVfOptvfUqDGu4Y"
 
+# Parsed BrandBio per lookup key, so planning and execution in one process don't re-resolve the brand
+BRAND_BIO_CACHE_TTL_SECONDS = 3600
+_brand_bio_cache: Dict[str, Tuple[float, BrandBio]] = {}
+
+def _bio_cache_key(identifier: str) -> str:
+    """Normalized brand slug ('Pop Brush' -> 'popbrush'), as CatalogManager normalizes brand names."""
+    return identifier.strip().lower().replace(" ", "")
+
+# Start the stats/reviews lookup for a slot's planned structure while the Strategist runs.
+# Costs one wasted Perplexity call when the Strategist switches to a structure needing other data.
+SPECULATIVE_ENRICHMENT = os.getenv("SPECULATIVE", "false").lower() == "true"
+
+# Deterministic repair turns per draft. _det_feedback asks for every failing field in one
+# turn, so two revisions are enough; raise it via MAX_DET_RETRIES if drafts keep failing.
+MAX_DET_RETRIES = int(os.getenv("MAX_DET_RETRIES", "2"))
+
+def _enrichment_kind(structure_id: Optional[str]) -> Optional[str]:
+    """Which real-world data a structure needs: 'stats', 'reviews' or None."""
+    if not structure_id:
+        return None
+    if "STAT_ATTACK" in structure_id:
+        return "stats"
+    if "SOCIAL_PROOF" in structure_id:
+        return "reviews"
+    return None
+
+def _det_feedback(draft, det_issues) -> str:
+    """
+    Builds one batched repair directive for the drafter: issues grouped per field, with the
+    current value, so every violation can be fixed in a single revision turn.
+    """
+    by_field: Dict[str, List] = {}
+    for issue in det_issues:
+        by_field.setdefault(issue.field, []).append(issue)
+
+    blocks = []
+    for field, issues in by_field.items():
+        current = getattr(draft, field, None)
+        header = f"- [{field}]" + (f" currently ({len(current)} chars): {current!r}" if isinstance(current, str) else "")
+        blocks.append(header + "".join(f"\n    * {i.problem} (Reason: {i.rationale})" for i in issues))
+
+    return (
+        "STRICT RULES VIOLATION. You MUST fix these before we can proceed.\n"
+        "Fix ALL fields listed below in this single revision and keep every other field unchanged:\n"
+        + "\n".join(blocks)
+    )
+
+async def _enrich(content_enricher: ContentEnricher, kind: str, brand_name: str, product_description: str) -> str:
+    if kind == "stats":
+        return await content_enricher.find_stats(brand_name, product_description)
+    return await content_enricher.find_reviews(brand_name, product_description)
+
+async def _load_brand_bio(brand_identifier: str, website_url: Optional[str] = None) -> BrandBio:
+    """
+    analyze_brand + BrandBio parsing, memoized for BRAND_BIO_CACHE_TTL_SECONDS.
+    The bio is cached under the slug of the lookup key and of its brand_id/brand_name, so a
+    plan created by name is found again when executed by brand_id. Errors are not cached.
+    """
+    key = _bio_cache_key(brand_identifier or website_url or "")
+    cached = _brand_bio_cache.get(key)
+    if cached and time.monotonic() - cached[0] < BRAND_BIO_CACHE_TTL_SECONDS:
+        return cached[1].model_copy()
+
+    analysis_result = await analyze_brand(brand_identifier, website_url=website_url)
+    brand_bio = BrandBio.model_validate_json(analysis_result)
+
+    entry = (time.monotonic(), brand_bio)
+    for alias in (key, brand_bio.brand_id, brand_bio.brand_name):
+        if alias:
+            _brand_bio_cache[_bio_cache_key(alias)] = entry
+    return brand_bio.model_copy()
+
 async def plan_campaign(
     brand_name: str,
     campaign_goal: str,
@@ -59,8 +160,13 @@ async def plan_campaign(
     tracker.reset()
     
     # 1. Analyze Brand (or load cached)
-    analysis_result = await analyze_brand(brand_name, website_url=website_url)
-    brand_bio = BrandBio(**json.loads(analysis_result))
+    brand_bio = await _load_brand_bio(brand_name, website_url=website_url)
+
+    # History does not change while planning: load it once, in the background while the planner runs
+    history_identifier = brand_bio.brand_id if getattr(brand_bio, 'brand_id', None) else brand_name
+    history_task = asyncio.create_task(
+        asyncio.to_thread(history_manager.get_recent_campaign_dicts, history_identifier, limit=10) # Get enough history
+    )
     
     # 2. Generate Initial Plan
     # Instantiate Session for this run
@@ -97,17 +203,15 @@ async def plan_campaign(
     # 3. Verification Loop (Judge + Repair)
     max_retries = 2 # Limit to 1 Revision Pass
     is_approved = False
+
+    past_campaigns_dicts = await history_task
+    print(f"[Plan QA] Loaded {len(past_campaigns_dicts)} history items for brand '{history_identifier}'")
     
     for attempt in range(max_retries):
         print(f"\n[Plan Verification] Attempt {attempt+1}/{max_retries}")
         
         # --- LAYER 1: Deterministic QA ---
-        history_identifier = brand_bio.brand_id if getattr(brand_bio, 'brand_id', None) else brand_name
-        past_campaigns = history_manager.get_recent_campaigns(history_identifier, limit=10) # Get enough history
-        print(f"[Plan QA] Loaded {len(past_campaigns)} history items for brand '{history_identifier}'")
-        past_campaigns_dicts = [entry.model_dump() for entry in past_campaigns]
-
-        det_issues = det_verifier.verify_plan(plan, past_campaigns_dicts)
+        det_issues = await asyncio.to_thread(det_verifier.verify_plan, plan, past_campaigns_dicts)
         
         if det_issues:
             print(f"[Plan Verification] Layer 1 (Deterministic) Failed. Issues: {len(det_issues)}")
@@ -158,7 +262,7 @@ async def plan_campaign(
     
     # 4. Save Plan
     # Ensure created_at is current
-    plan.created_at = datetime.utcnow().isoformat() + "Z"
+    plan.created_at = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
     # Re-apply IDs to ensure they weren't lost during QA revision
     if campaign_id:
         plan.campaign_id = campaign_id
@@ -167,32 +271,36 @@ async def plan_campaign(
         plan.brand_id = brand_bio.brand_id
 
     # 4. Save Plan
-    campaign_manager.save_plan(plan)
+    await asyncio.to_thread(get_campaign_manager().save_plan, plan)
     
     # 5. Export Plan Summary to Google Sheets (Updated Feature)
-    sheet_url = "N/A"
-    try:
+    # Started as a background task so the Sheets round-trip overlaps the token report.
+    async def _export_plan():
         from email_orchestrator.tools.google_sheets_export import export_plan_to_google_sheets
-        
-        # We pass the plan object converted to dict, as the tool expects a dict-like structure or we adjust it.
-        # The Pydantic model .dict() is suitable.
-        sheet_result = export_plan_to_google_sheets(
-            plan_data=plan.dict(),
+        return await asyncio.to_thread(
+            export_plan_to_google_sheets,
+            # The exporter expects a plain dict; mode="json" yields JSON-ready values in one C-level pass.
+            plan_data=plan.model_dump(mode="json"),
             folder_id=drive_folder_id
         )
+    export_task = asyncio.create_task(_export_plan())
+    
+    # 6. Report Tokens
+    print(tracker.get_summary())
+    
+    sheet_url = "N/A"
+    try:
+        sheet_result = await export_task
         sheet_url = sheet_result['spreadsheet_url']
         print(f"[Export] Plan exported to: {sheet_url} (Folder: {drive_folder_id})")
         
         # Save Sheet URL to Plan
         plan.sheet_url = sheet_url
-        campaign_manager.save_plan(plan)
+        await asyncio.to_thread(get_campaign_manager().save_plan, plan)
             
     except Exception as e:
         print(f"[Export] Plan Export Failed: {e}")
     
-    # 6. Report Tokens
-    print(tracker.get_summary())
-    
     # PHASE 1 COMPLETE: Return Info for CLI
     return f"Campaign Plan Created! ID: {plan.campaign_id}\nGoogle Sheet: {sheet_url}"
 
@@ -214,22 +322,21 @@ async def generate_email_campaign(
     tracker.reset()
     
     # 1. Load Plan
-    plan = campaign_manager.get_plan(campaign_id)
+    plan = await asyncio.to_thread(get_campaign_manager().get_plan, campaign_id)
     if not plan:
         return f"Error: Campaign {campaign_id} not found."
     
     # Load Brand Bio
     # Use brand_id if available, fallback to brand_name
     lookup_id = plan.brand_id if plan.brand_id else plan.brand_name
-    analysis_result = await analyze_brand(lookup_id)
-    brand_bio = BrandBio(**json.loads(analysis_result))
+    brand_bio = await _load_brand_bio(lookup_id)
 
     # --- NEW: Sync from Google Sheet if available ---
     if getattr(plan, 'sheet_url', None) and "docs.google.com" in plan.sheet_url:
         print(f"\n[Importer] 📡 Syncing plan from Google Sheet: {plan.sheet_url}")
         try:
             from email_orchestrator.tools.google_sheets_importer import import_plan_from_sheet
-            sheet_data = import_plan_from_sheet(plan.sheet_url)
+            sheet_data = await asyncio.to_thread(import_plan_from_sheet, plan.sheet_url)
             
             # 1. Update Global Fields
             if sheet_data.get('campaign_context'):
@@ -279,61 +386,99 @@ async def generate_email_campaign(
 
     target_languages = plan.languages or ["FR"]
 
-    for slot in plan.email_slots:
-        # FILTER: If target_slots is provided, skip others
-        if target_slots and slot.slot_number not in target_slots:
-            continue
-            
-        print(f"\n>>> PROCESSING EMAIL #{slot.slot_number} ({slot.email_purpose}) <<<")
-        
+    # The semaphore caps how many slots hit the LLM at once, Strategist included.
+    # Defaults to 1 (sequential): the one-emoji-per-campaign rule and emoji pacing in the
+    # deterministic verifier only see slots that already finished, so slots drafted side by
+    # side can each add an emoji. EMAIL_CONCURRENCY>1 trades that guarantee for speed.
+    sem = asyncio.Semaphore(int(os.getenv("EMAIL_CONCURRENCY", "1")))
+
+    # Determine history for this brand/ isolation (invariant for the whole run)
+    history_identifier = brand_bio.brand_id if getattr(brand_bio, 'brand_id', None) else plan.brand_name
+
+
+    def _strategist_request(slot) -> CampaignRequest:
+        """Builds the Strategist request from the slot directives."""
+        # STRICT RULE: If Educational/Nurture, HIDE the offer to prevent leakage
+        effective_offer = slot.offer_details or "General Brand Awareness"
+        if slot.email_purpose in ["educational", "nurture", "storytelling"]:
+            effective_offer = "NONE (Focus purely on value/content)"
+
+        # Built from our own validated plan and bio, so validation is skipped
+        return CampaignRequest.model_construct(
+            brand_name=plan.brand_name,
+            offer=effective_offer,
+            theme_angle=slot.theme,
+            target_audience=brand_bio.target_audience
+        )
+
+    async def _run_slot(slot, slot_logs: List[CampaignLogEntry]) -> List[Dict]:
+        """
+        Runs the full pipeline (primary + transcreations) for one slot.
+        Returns one result dict per language; history entries are collected in slot_logs.
+        """
+        slot_results = []
+        logger.info(f"\n>>> PROCESSING EMAIL #{slot.slot_number} ({slot.email_purpose}) <<<")
+    
         # 1. PRIMARY RUN (Generate from scratch)
         primary_lang = target_languages[0]
         primary_draft_captured = None # Holder for translation
-        
+    
         for lang in [primary_lang]:
-            print(f"   > [Primary Language: {lang}]")
-            
+            logger.info(f"   > [Primary Language: {lang}]")
+        
             try:
-                # A. Strategist (Create Blueprint using Slot Directives)
-                # STRICT RULE: If Educational/Nurture, HIDE the offer to prevent leakage
-                effective_offer = slot.offer_details or "General Brand Awareness"
-                if slot.email_purpose in ["educational", "nurture", "storytelling"]:
-                    effective_offer = "NONE (Focus purely on value/content)"
-            
-                request = CampaignRequest(
-                    brand_name=plan.brand_name,
-                    offer=effective_offer,
-                    theme_angle=slot.theme,
-                    target_audience=brand_bio.target_audience
-                )
-            
+                # A. Strategist (requested once the slot holds the semaphore, so EMAIL_CONCURRENCY caps it too)
+                # SPECULATIVE: start enrichment for the planned structure while the Strategist runs
+                planned_kind = _enrichment_kind(slot.structure_id) if SPECULATIVE_ENRICHMENT else None
+                speculative_enrichment = None
+                if planned_kind:
+                    speculative_enrichment = asyncio.create_task(
+                        _enrich(content_enricher, planned_kind, plan.brand_name, brand_bio.product_description)
+                    )
+        
                 # Pass folder selection context? Not needed for Strategist.
-                blueprint = await strategist_agent(request, brand_bio, campaign_context=slot, language=lang)
-            
+                try:
+                    blueprint = await strategist_agent(
+                        _strategist_request(slot), brand_bio, campaign_context=slot, language=lang
+                    )
+                except BaseException:
+                    if speculative_enrichment:
+                        speculative_enrichment.cancel()
+                    raise
+        
                 # --- CONTENT ENRICHMENT (New Layer) ---
                 real_world_data = ""
-                if "STAT_ATTACK" in blueprint.structure_id:
-                     real_world_data = await content_enricher.find_stats(plan.brand_name, brand_bio.product_description)
-                elif "SOCIAL_PROOF" in blueprint.structure_id:
-                     real_world_data = await content_enricher.find_reviews(plan.brand_name, brand_bio.product_description)
+                enrichment_kind = _enrichment_kind(blueprint.structure_id)
+                if speculative_enrichment:
+                    speculation_hit = enrichment_kind == planned_kind
+                    tracker.log_speculation("enrichment", hit=speculation_hit)
+                    if speculation_hit:
+                        real_world_data = await speculative_enrichment
+                    else:
+                        speculative_enrichment.cancel()
+                        speculative_enrichment = None
+                if enrichment_kind and not speculative_enrichment:
+                    real_world_data = await _enrich(content_enricher, enrichment_kind, plan.brand_name, brand_bio.product_description)
 
                 # B. Bundled Generation (Drafter + Stylist)
                 final_draft = None
                 revision_feedback = None
-            
-                # Determine history for this brand/ isolation
-                history_identifier = brand_bio.brand_id if getattr(brand_bio, 'brand_id', None) else plan.brand_name
-                past_emails = history_manager.get_recent_campaigns(history_identifier, limit=10)
-                past_emails_dicts = [entry.model_dump() for entry in past_emails]
-    
+        
+                # Determine history for this brand/ isolation. Read per slot on purpose: emoji pacing
+                # must see emails finished earlier in this run (each slot logs them when it completes).
+                past_emails_dicts = await asyncio.to_thread(history_manager.get_recent_campaign_dicts, history_identifier, limit=10)
+
                 # SESSION START
                 from email_orchestrator.subagents.drafter_agent import DraftingSession
                 drafting_session = DraftingSession(blueprint, brand_bio, language=lang, campaign_context=plan.campaign_context)
 
                 # --- HELPER: Draft & Style Bundle ---
-                async def generate_and_style(feedback: Optional[str] = None):
+                async def generate_and_style(feedback: Optional[str] = None, early_exit: bool = False):
                     """
                     Bundles Drafting and Styling.
+                    Returns (draft, early_issues). With early_exit, a raw draft that already fails
+                    the style-independent deterministic checks is returned unstyled with those
+                    issues, saving the Stylist call on a draft that will be revised anyway.
                     """
                     if feedback:
                         # Revision
@@ -341,7 +486,13 @@ async def generate_email_campaign(
                     else:
                         # Fresh Start
                         raw_draft = await drafting_session.start(real_world_data=real_world_data)
-                
+
+                    if early_exit:
+                        early_issues = await asyncio.to_thread(det_verifier.verify_draft_partial, raw_draft, history=past_emails_dicts, campaign_id=plan.campaign_id)
+                        if early_issues:
+                            logger.info(f"[Email #{slot.slot_number}-{lang}] Layer 1 early reject ({len(early_issues)} issues), skipping Stylist.")
+                            return raw_draft, early_issues
+            
                     # Apply Styling immediately
                     # Stylist works on the raw draft and returns styled HTML for the body
                     try:
@@ -355,66 +506,66 @@ async def generate_email_campaign(
                             )
                             raw_draft.descriptive_block_content = styled_desc
                     except Exception as e:
-                        print(f"[Email #{slot.slot_number}-{lang}] Stylist failed, keeping raw draft: {e}")
-                
-                    return raw_draft
+                        logger.info(f"[Email #{slot.slot_number}-{lang}] Stylist failed, keeping raw draft: {e}")
+            
+                    return raw_draft, None
 
                 # 1. INITIAL BUNDLE
-                current_draft = await generate_and_style(None)
-            
+                current_draft, det_issues = await generate_and_style(None, early_exit=True)
+        
                 # 2. DETERMINISTIC VERIFICATION LOOP (Checks the STYLED draft)
-                max_det_retries = 3
+                max_det_retries = MAX_DET_RETRIES
                 det_attempt = 0
-            
+        
                 while det_attempt < max_det_retries:
-                    det_issues = det_verifier.verify_draft(current_draft, history=past_emails_dicts, campaign_id=plan.campaign_id)
-                
+                    if det_issues is None:
+                        det_issues = await asyncio.to_thread(det_verifier.verify_draft, current_draft, history=past_emails_dicts, campaign_id=plan.campaign_id)
+            
                     if not det_issues:
-                        print(f"[Email #{slot.slot_number}-{lang}] Layer 1 (Deterministic) Passed.")
+                        logger.info(f"[Email #{slot.slot_number}-{lang}] Layer 1 (Deterministic) Passed.")
                         break
-                    
-                    det_attempt += 1
-                    print(f"[Email #{slot.slot_number}-{lang}] Layer 1 FAILED ({len(det_issues)} issues). Retry {det_attempt}/{max_det_retries}...")
                 
+                    det_attempt += 1
+                    logger.info(f"[Email #{slot.slot_number}-{lang}] Layer 1 FAILED ({len(det_issues)} issues). Retry {det_attempt}/{max_det_retries}...")
+            
                     # Construct feedback
-                    feedback_msg = "STRICT RULES VIOLATION. You MUST fix these before we can proceed:\n"
-                    feedback_msg += "\n".join([f"- [{i.field}] {i.problem} (Reason: {i.rationale})" for i in det_issues])
-                    print(f"[Email #{slot.slot_number}-{lang}] DET FEEDBACK SENT TO DRAFTER:\n{feedback_msg}")
-                
-                    # REVISE & RE-STYLE
-                    current_draft = await generate_and_style(feedback_msg)
-    
+                    feedback_msg = _det_feedback(current_draft, det_issues)
+                    logger.info(f"[Email #{slot.slot_number}-{lang}] DET FEEDBACK SENT TO DRAFTER:\n{feedback_msg}")
+            
+                    # REVISE & RE-STYLE (the last attempt is never verified here, so always style it)
+                    current_draft, det_issues = await generate_and_style(feedback_msg, early_exit=det_attempt < max_det_retries)
+
                 if det_attempt >= max_det_retries:
-                    print(f"[Email #{slot.slot_number}-{lang}] CRITICAL: Failed to fix deterministic issues after {max_det_retries} attempts.")
+                    logger.info(f"[Email #{slot.slot_number}-{lang}] CRITICAL: Failed to fix deterministic issues after {max_det_retries} attempts.")
 
                 # 3. LLM QA LOOP (Checks the final STYLED draft)
-                print(f"[Email #{slot.slot_number}-{lang}] Proceeding to LLM QA (Verifier)...")
+                logger.info(f"[Email #{slot.slot_number}-{lang}] Proceeding to LLM QA (Verifier)...")
                 verification = await verifier_agent(current_draft, blueprint, plan.brand_name, campaign_context=plan.campaign_context)
-            
+        
                 if verification.approved:
-                    print(f"[Email #{slot.slot_number}-{lang}] APPROVED! Score: {verification.score}")
+                    logger.info(f"[Email #{slot.slot_number}-{lang}] APPROVED! Score: {verification.score}")
                     final_draft = current_draft
                 else:
-                    print(f"[Email #{slot.slot_number}-{lang}] REJECTED. Requesting ONE-TIME Strategic Revision...")
-                
+                    logger.info(f"[Email #{slot.slot_number}-{lang}] REJECTED. Requesting ONE-TIME Strategic Revision...")
+            
                     # Construct detailed feedback
-                    feedback_lines = [f"QA VERDICT: {verification.feedback_for_drafter}"]
-                    for imp in verification.top_improvements:
-                        feedback_lines.append(f"- [Rank {imp.rank}] [{imp.category}] {imp.problem}")
-                        feedback_lines.append(f"  Fix Options: {json.dumps(imp.options)}")
-                    revision_feedback = "\n".join(feedback_lines)
-                
+                    revision_feedback = f"QA VERDICT: {verification.feedback_for_drafter}" + "".join(
+                        f"\n- [Rank {imp.rank}] [{imp.category}] {imp.problem}"
+                        f"\n  Fix Options: {fast_json.dumps(imp.options)}"
+                        for imp in verification.top_improvements
+                    )
+            
                     # REVISE & RE-STYLE (Final Pass)
-                    final_draft = await generate_and_style(revision_feedback)
-                
+                    final_draft, _ = await generate_and_style(revision_feedback)
+            
                     # Final Deterministic Check on revised draft (Safety)
-                    final_det = det_verifier.verify_draft(final_draft, history=past_emails_dicts, campaign_id=plan.campaign_id)
+                    final_det = await asyncio.to_thread(det_verifier.verify_draft, final_draft, history=past_emails_dicts, campaign_id=plan.campaign_id)
                     if final_det:
-                        print(f"[Email #{slot.slot_number}-{lang}] Warning: Revised draft still has {len(final_det)} deterministic issues.")
-                
-                    print(f"[Email #{slot.slot_number}-{lang}] Revision complete. Auto-approving for export.")
-                    primary_draft_captured = final_draft
+                        logger.info(f"[Email #{slot.slot_number}-{lang}] Warning: Revised draft still has {len(final_det)} deterministic issues.")
             
+                    logger.info(f"[Email #{slot.slot_number}-{lang}] Revision complete. Auto-approving for export.")
+                    primary_draft_captured = final_draft
+        
                 # --- FINAL SAFETY NET (The "Sanitizer") ---
                 # User reported dashes persisting. We will strictly strip them here.
                 # This handles cases where Stylist or Drafter (after N retries) still failed.
@@ -430,10 +581,10 @@ async def generate_email_campaign(
                      final_draft.preview = sanitize_text(final_draft.preview)
                      final_draft.hero_subtitle = sanitize_text(final_draft.hero_subtitle)
                      final_draft.descriptive_block_subtitle = sanitize_text(final_draft.descriptive_block_subtitle)
-            
+        
                 log_entry = CampaignLogEntry(
                     campaign_id=campaign_id,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=datetime.now().isoformat(),  # local, same format as the existing log
                     brand_id=plan.brand_id, 
                     brand_name=plan.brand_name,
                     transformation_description=blueprint.transformation_description,
@@ -447,10 +598,10 @@ async def generate_email_campaign(
                     blueprint=blueprint,
                     final_draft=final_draft
                 )
-                history_manager.log_campaign(log_entry)
-            
+                slot_logs.append(log_entry)
+        
                 # Serialize full draft for compiler
-                draft_data = final_draft.dict()
+                draft_data = final_draft.model_dump(mode="json")
                 draft_data.update({
                     "slot_number": slot.slot_number,
                     "status": "completed",
@@ -458,26 +609,24 @@ async def generate_email_campaign(
                     "structure_id": blueprint.structure_id,
                     "language": lang 
                 })
-                results.append(draft_data)
+                slot_results.append(draft_data)
             except Exception as e:
-                print(f"[Email #{slot.slot_number}-{lang}] ERROR processing slot: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                results.append({
+                logger.exception(f"[Email #{slot.slot_number}-{lang}] ERROR processing slot: {str(e)}")
+                slot_results.append({
                     "slot_number": slot.slot_number,
                     "status": "failed",
                     "error": str(e),
                     "language": lang
                 })
-        
+    
         # 2. SECONDARY RUN (Transcreation)
         secondary_langs = target_languages[1:]
         if secondary_langs and primary_draft_captured:
             from email_orchestrator.subagents.translator_agent import TranslatorAgent
             translator = TranslatorAgent()
-            
+        
             for sec_lang in secondary_langs:
-                print(f"   > [Secondary Language: {sec_lang}] (Transcreating from {primary_lang})...")
+                logger.info(f"   > [Secondary Language: {sec_lang}] (Transcreating from {primary_lang})...")
                 try:
                     sec_draft = await translator.transcreate_draft(
                         source_draft=primary_draft_captured,
@@ -485,7 +634,7 @@ async def generate_email_campaign(
                         target_lang=sec_lang,
                         brand_voice=brand_bio.brand_voice
                     )
-                    
+                
                     # Log & Save
                     log_entry = CampaignLogEntry(
                         campaign_id=campaign_id,
@@ -504,9 +653,9 @@ async def generate_email_campaign(
                         blueprint=blueprint,
                         final_draft=sec_draft
                     )
-                    history_manager.log_campaign(log_entry)
-                    
-                    draft_data = sec_draft.dict()
+                    slot_logs.append(log_entry)
+                
+                    draft_data = sec_draft.model_dump(mode="json")
                     draft_data.update({
                         "slot_number": slot.slot_number,
                         "status": "completed",
@@ -514,17 +663,19 @@ async def generate_email_campaign(
                         "structure_id": blueprint.structure_id,
                         "language": sec_lang
                     })
-                    results.append(draft_data)
-                    print(f"[Email #{slot.slot_number}-{sec_lang}] Transcreation COMPLETE.")
-                    
+                    slot_results.append(draft_data)
+                    logger.info(f"[Email #{slot.slot_number}-{sec_lang}] Transcreation COMPLETE.")
+                
                 except Exception as e:
-                    print(f"[Email #{slot.slot_number}-{sec_lang}] Transcreation FAILED: {e}")
-                    results.append({"slot_number": slot.slot_number, "status": "failed", "error": str(e), "language": sec_lang})
-        
+                    logger.info(f"[Email #{slot.slot_number}-{sec_lang}] Transcreation FAILED: {e}")
+                    slot_results.append({"slot_number": slot.slot_number, "status": "failed", "error": str(e), "language": sec_lang})
+    
         # F. Export to Google Docs (LEGACY - Disabled)
         # try:
-        #     doc_result = export_email_to_google_docs(
-        #         email_draft=final_draft.dict(),
+        #     from email_orchestrator.tools.google_docs_export import export_email_to_google_docs
+        #     doc_result = await asyncio.to_thread(
+        #         export_email_to_google_docs,
+        #         email_draft=final_draft.model_dump(mode="json"),
         #         brand_name=plan.brand_name,
         #         folder_id=drive_folder_id, # Use the passed folder ID
         #         structure_name=blueprint.structure_id,
@@ -534,8 +685,38 @@ async def generate_email_campaign(
         # except Exception as e:
         #     print(f"[Export] Failed to export doc: {e}")
 
+        return slot_results
+
+    async def _process_slot(slot) -> List[Dict]:
+        """Runs one slot under the semaphore and logs its emails before releasing it."""
+        slot_logs: List[CampaignLogEntry] = []
+        async with sem:
+            try:
+                return await _run_slot(slot, slot_logs)
+            finally:
+                # Written before the next slot starts, so its Strategist, Verifier and
+                # deterministic checks see the emails finished earlier in this run
+                await asyncio.to_thread(history_manager.log_campaigns_batch, slot_logs)
+
+    # FILTER: If target_slots is provided, skip others
+    slots_to_run = [s for s in plan.email_slots if not target_slots or s.slot_number in target_slots]
+
+    slot_outcomes = await asyncio.gather(*[_process_slot(s) for s in slots_to_run], return_exceptions=True)
+
+    for slot, outcome in zip(slots_to_run, slot_outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"[Email #{slot.slot_number}] ERROR processing slot: {outcome}")
+            results.append({"slot_number": slot.slot_number, "status": "failed", "error": str(outcome)})
+        else:
+            results.extend(outcome)
+
+    # Keep output in slot order regardless of completion order (sort is stable, so languages stay primary-first)
+    results.sort(key=lambda r: r.get("slot_number", 0))
+
+    # Let the listener drain queued slot logs so the summary prints after them
+    await asyncio.to_thread(_log_queue.join)
 
     print("\n--- CAMPAIGN EXECUTION FINISHED ---")
     print(tracker.get_summary())
     
-    return json.dumps(results, indent=2)
+    return fast_json.dumps(results, indent=True)
@@ -1,7 +1,8 @@
-import json
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 
+from email_orchestrator.tools import fast_json
+
 class CatalogManager:
     """
     Manages loading and searching of global and brand-specific catalogs.
@@ -23,6 +24,9 @@ class CatalogManager:
         self.catalogs_dir = Path("catalogs")
         self.global_catalogs: Dict[str, List[Dict]] = {}
         self.brand_catalogs: Dict[str, Dict[str, List[Dict]]] = {} # brand -> type -> list
+        # id -> item views of the lists above, built once at load for O(1) get_item
+        self.global_index: Dict[str, Dict[str, Dict]] = {} # type -> id -> item
+        self.brand_index: Dict[str, Dict[str, Dict[str, Dict]]] = {} # brand -> type -> id -> item
         
         self.known_global_types = ["structures", "angles", "cta_styles"]
         self.known_brand_types = ["personas", "transformations"]
@@ -39,11 +43,12 @@ class CatalogManager:
                 path = global_dir / f"{cat_type}.json"
                 if path.exists():
                     try:
-                        self.global_catalogs[cat_type] = json.loads(path.read_text(encoding="utf-8"))
+                        self.global_catalogs[cat_type] = fast_json.loads(path.read_bytes())
                         #print(f"[CatalogManager] Loaded global/{cat_type}: {len(self.global_catalogs[cat_type])} items")
                     except Exception as e:
                         #print(f"[CatalogManager] Error loading global/{cat_type}: {e}")
                         self.global_catalogs[cat_type] = []
+                    self.global_index[cat_type] = self._index_by_id(self.global_catalogs[cat_type])
         
         # Load Brands
         brands_dir = self.catalogs_dir / "brands"
@@ -57,11 +62,25 @@ class CatalogManager:
                         path = brand_dir / f"{cat_type}.json"
                         if path.exists():
                             try:
-                                self.brand_catalogs[brand_slug][cat_type] = json.loads(path.read_text(encoding="utf-8"))
+                                self.brand_catalogs[brand_slug][cat_type] = fast_json.loads(path.read_bytes())
                                 #print(f"[CatalogManager] Loaded brands/{brand_slug}/{cat_type}: {len(self.brand_catalogs[brand_slug][cat_type])} items")
                             except Exception as e:
                                 #print(f"[CatalogManager] Error loading brands/{brand_slug}/{cat_type}: {e}")
                                 self.brand_catalogs[brand_slug][cat_type] = []
+                    
+                    self.brand_index[brand_slug] = {
+                        cat_type: self._index_by_id(items)
+                        for cat_type, items in self.brand_catalogs[brand_slug].items()
+                    }
+
+    @staticmethod
+    def _index_by_id(items: List[Dict]) -> Dict[str, Dict]:
+        """Map item id -> item. The first item wins on duplicate ids, like the old linear scan."""
+        index: Dict[str, Dict] = {}
+        for item in items:
+            if isinstance(item, dict) and "id" in item:
+                index.setdefault(item["id"], item)
+        return index
 
     def get_global_catalog(self, cat_type: str) -> List[Dict]:
         """Get full list of items for a global catalog type."""
@@ -79,21 +98,25 @@ class CatalogManager:
         """
         # Check Global
         if cat_type in self.known_global_types:
-            for item in self.get_global_catalog(cat_type):
-                if item["id"] == item_id:
-                    return item
+            item = self.global_index.get(cat_type, {}).get(item_id)
+            if item is not None:
+                return item
         
         # Check Brand
         if brand_name and cat_type in self.known_brand_types:
-            for item in self.get_brand_catalog(brand_name, cat_type):
-                if item["id"] == item_id:
-                    return item
+            brand_slug = self._normalize_brand(brand_name)
+            return self.brand_index.get(brand_slug, {}).get(cat_type, {}).get(item_id)
                     
         return None
 
     def validate_id(self, cat_type: str, item_id: str, brand_name: Optional[str] = None) -> bool:
         """Check if an ID exists in the specified catalog."""
-        return self.get_item(cat_type, item_id, brand_name) is not None
+        if cat_type in self.known_global_types and item_id in self.global_index.get(cat_type, {}):
+            return True
+        if brand_name and cat_type in self.known_brand_types:
+            brand_slug = self._normalize_brand(brand_name)
+            return item_id in self.brand_index.get(brand_slug, {}).get(cat_type, {})
+        return False
         
     def _normalize_brand(self, brand_name: str) -> str:
         """Convert 'PopBrush' -> 'popbrush'."""
@@ -1,6 +1,6 @@
 import re
 from typing import List, Dict, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 try:
     from rapidfuzz import fuzz
 except ImportError:
@@ -14,6 +14,21 @@ except ImportError:
 
 from email_orchestrator.schemas import EmailDraft, CampaignPlan, Issue
 
+# Patterns are compiled once at import; the checks run per field, per draft and per history entry.
+# Expanded regex for emojis including BMP characters
+# Blocks: Emoticons, Dingbats, Symbols & Pictographs, Transport, etc.
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U00010000-\U0010ffff"  # Supplementary Plane
+    "\u2600-\u27bf"          # Misc Symbols, Dingbats (Snowflake is here)
+    "\u2300-\u23ff"          # Misc Technical (Watch, etc)
+    "\u2b50"                 # Star
+    "\u203c-\u2049"          # Double exclamation, etc
+    "]+", flags=re.UNICODE)
+
+# Simple regex for tag-like structures
+HTML_TAG_PATTERN = re.compile(r"</?[a-z][\s\S]*?>", re.IGNORECASE)
+
 class DeterministicVerifier:
     """
     Layer 1 QA: Cheap, fast, deterministic checks.
@@ -280,6 +295,19 @@ class DeterministicVerifier:
 
         return issues
     
+    # Fields the Stylist rewrites after drafting; checks on them only count on the styled draft.
+    STYLED_FIELDS = ("descriptive_block_content",)
+
+    def verify_draft_partial(self, draft: EmailDraft, history: List[Dict] = None, campaign_id: str = None) -> List[Issue]:
+        """
+        Runs the draft checks that styling cannot change (subject, preview, headers, ...).
+        Any issue here already rejects the draft, so the caller can skip styling it.
+        """
+        return [
+            issue for issue in self.verify_draft(draft, history=history, campaign_id=campaign_id)
+            if issue.field not in self.STYLED_FIELDS
+        ]
+
     def _contains_banned_dashes(self, text: str) -> bool:
         """Check for -, –, —"""
         # We need to be careful. User said "Never ever".
@@ -295,23 +323,12 @@ class DeterministicVerifier:
 
     def _contains_emoji(self, text: str) -> bool:
         """Simple emoji detection check."""
-        # Expanded regex for emojis including BMP characters
-        # Blocks: Emoticons, Dingbats, Symbols & Pictographs, Transport, etc.
-        emoji_pattern = re.compile(
-            "["
-            "\U00010000-\U0010ffff"  # Supplementary Plane
-            "\u2600-\u27bf"          # Misc Symbols, Dingbats (Snowflake is here)
-            "\u2300-\u23ff"          # Misc Technical (Watch, etc)
-            "\u2b50"                 # Star
-            "\u203c-\u2049"          # Double exclamation, etc
-            "]+", flags=re.UNICODE)
-        return bool(emoji_pattern.search(text))
+        return bool(EMOJI_PATTERN.search(text))
 
     def _contains_html_tags(self, text: str) -> bool:
         """Checks for presence of basic HTML tags like <b>, <i>, <u>, <br>."""
         if not text: return False
-        # Simple regex for tag-like structures
-        return bool(re.search(r"</?[a-z][\s\S]*?>", text, re.IGNORECASE))
+        return bool(HTML_TAG_PATTERN.search(text))
 
     def verify_plan(self, plan: CampaignPlan, history: List[Dict]) -> List[Issue]:
         """Runs deterministic checks on a campaign plan."""
@@ -333,7 +350,7 @@ class DeterministicVerifier:
                 plan_date = plan_date.replace(tzinfo=None) # naive comparison if needed
         except ValueError:
             # Fallback if parsing fails
-            plan_date = datetime.utcnow()
+            plan_date = datetime.now(timezone.utc)
 
         print(f"\n[Verifier Logic] Analyzing History for Plan '{plan.campaign_name}' ({plan.created_at})...")
         
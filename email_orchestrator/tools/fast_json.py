@@ -0,0 +1,30 @@
+"""
+JSON helpers backed by orjson when it is installed.
+
+orjson is several times faster than the stdlib for the payloads this
+pipeline moves around (LLM responses, plan/draft dicts, tool results).
+The stdlib json module is used as a fallback so orjson stays optional.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize to a JSON str (2-space indent when indent=True)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
@@ -26,6 +26,11 @@ SCOPES = [
     'https://www.googleapis.com/auth/documents'
 ]
 
+# Partial-response masks for documents().get: only the body is ever inspected
+END_INDEX_FIELDS = 'body.content(endIndex)'
+BODY_CONTENT_FIELDS = 'body.content'
+GOOGLE_DOC_MIME_TYPE = 'application/vnd.google-apps.document'
+
 # Credentials file path (can be overridden by env var)
 DEFAULT_CREDENTIALS_PATH = Path(__file__).parent.parent.parent / "google_credentials.json"
 
@@ -81,27 +86,6 @@ class GoogleDocsExporter:
         except Exception as e:
             raise Exception(f"Failed to authenticate with Google: {e}")
 
-    def _move_to_folder(self, file_id: str, folder_id: str):
-        """Move file to specific Drive folder."""
-        try:
-            # Retrieve the existing parents to remove
-            file = self.drive_service.files().get(
-                fileId=file_id,
-                fields='parents'
-            ).execute()
-            previous_parents = ",".join(file.get('parents'))
-            
-            # Move the file by adding the new parent and removing the old one
-            self.drive_service.files().update(
-                fileId=file_id,
-                addParents=folder_id,
-                removeParents=previous_parents,
-                fields='id, parents'
-            ).execute()
-            print(f"[GoogleDocs] ✓ Moved to folder: {folder_id}")
-        except HttpError as e:
-            print(f"[GoogleDocs] Warning: Could not move to folder {folder_id}: {e}")
-    
     def create_email_doc(
         self,
         email_draft: Dict[str, Any],
@@ -119,21 +103,13 @@ class GoogleDocsExporter:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             doc_title = f"{brand_name} - {subject} - {timestamp}"
             
-            # Create empty document
-            doc = self.docs_service.documents().create(
-                body={'title': doc_title}
-            ).execute()
-            
-            document_id = doc.get('documentId')
+            # Create empty document (directly inside the folder if specified)
+            document_id = create_doc(self.docs_service, self.drive_service, doc_title, folder_id)
             print(f"[GoogleDocs] Created document: {doc_title}")
             
             # --- EXECUTE CONTENT ---
             write_email_to_doc(self.docs_service, document_id, email_draft, structure_name, language)
             
-            # Move to folder if specified
-            if folder_id:
-                self._move_to_folder(document_id, folder_id)
-            
             # Get shareable link
             doc_url = f"https://docs.google.com/document/d/{document_id}/edit"
             
@@ -146,6 +122,27 @@ class GoogleDocsExporter:
         except HttpError as e:
             raise Exception(f"Google Docs API error: {e}")
 
+# --- REUSABLE DOC CREATION ---
+def create_doc(docs_service, drive_service, title: str, folder_id: Optional[str] = None) -> str:
+    """
+    Creates an empty Google Doc and returns its ID.
+    With a folder, the doc is created there in one Drive call instead of
+    documents().create + files().get + files().update (create-then-move).
+    If that fails the doc is created in the Drive root, as a failed move did before.
+    """
+    if folder_id:
+        try:
+            file = drive_service.files().create(
+                body={'name': title, 'mimeType': GOOGLE_DOC_MIME_TYPE, 'parents': [folder_id]},
+                fields='id'
+            ).execute()
+            return file.get('id')
+        except HttpError as e:
+            print(f"[GoogleDocs] Warning: Could not create doc in folder {folder_id}: {e}")
+
+    doc = docs_service.documents().create(body={'title': title}).execute()
+    return doc.get('documentId')
+
 # --- REUSABLE WRITER FUNCTION ---
 def write_email_to_doc(docs_service, document_id: str, email_draft: Dict[str, Any], structure_name: str, language: str, header_text: Optional[str] = None):
     """
@@ -157,7 +154,7 @@ def write_email_to_doc(docs_service, document_id: str, email_draft: Dict[str, An
     requests_queue = []
     
     # 1. Get Initial End Index
-    doc = docs_service.documents().get(documentId=document_id).execute()
+    doc = docs_service.documents().get(documentId=document_id, fields=END_INDEX_FIELDS).execute()
     curr_doc_end_index = doc.get('body').get('content')[-1].get('endIndex') - 1
     virtual_cursor_index = curr_doc_end_index
     
@@ -176,7 +173,7 @@ def write_email_to_doc(docs_service, document_id: str, email_draft: Dict[str, An
             requests_queue = []
         
         # Always refresh index to be safe
-        doc = docs_service.documents().get(documentId=document_id).execute()
+        doc = docs_service.documents().get(documentId=document_id, fields=END_INDEX_FIELDS).execute()
         curr_doc_end_index = doc.get('body').get('content')[-1].get('endIndex') - 1
         virtual_cursor_index = curr_doc_end_index
 
@@ -377,7 +374,7 @@ def write_email_to_doc(docs_service, document_id: str, email_draft: Dict[str, An
                 flush_and_refresh() 
                 
                 # Logic to find table (heuristic: last structure with table)
-                doc = docs_service.documents().get(documentId=document_id).execute()
+                doc = docs_service.documents().get(documentId=document_id, fields=BODY_CONTENT_FIELDS).execute()
                 body_content = doc.get('body', {}).get('content', [])
                 validation_table = None
                 
@@ -417,7 +414,7 @@ def write_email_to_doc(docs_service, document_id: str, email_draft: Dict[str, An
                     print("[GoogleDocs] Warning: precise table target not found. Retrying fetch...")
                     import time
                     time.sleep(2)
-                    doc = docs_service.documents().get(documentId=document_id).execute()
+                    doc = docs_service.documents().get(documentId=document_id, fields=BODY_CONTENT_FIELDS).execute()
                     body_content = doc.get('body', {}).get('content', [])
                     for element in reversed(body_content):
                         if 'table' in element and is_table_empty(element['table']):
@@ -607,21 +604,16 @@ def write_email_to_doc(docs_service, document_id: str, email_draft: Dict[str, An
         except HttpError as e:
             print(f"[GoogleDocs] Warning: Could not share document: {e}")
 
-# Convenience function
-def export_email_to_google_docs(
-    email_draft: Dict[str, Any],
-    brand_name: str,
-    folder_id: Optional[str] = None,
-    share_with: Optional[str] = None,
-    structure_name: str = "Unknown Structure",
-    language: str = "English"
-) -> Dict[str, str]:
-    """
-    Export an email draft to Google Docs.
-    """
-    exporter = GoogleDocsExporter()
-    return exporter.create_email_doc(email_draft, brand_name, folder_id, structure_name, language)
+# Authenticated once per process: credential probing, token refresh and service discovery
+# only change at deploy time. The services refresh expired tokens on their own.
+_exporter = None
 
+def get_docs_exporter() -> GoogleDocsExporter:
+    """Get or create the shared GoogleDocsExporter"""
+    global _exporter
+    if _exporter is None:
+        _exporter = GoogleDocsExporter()
+    return _exporter
 
 # Convenience function
 def export_email_to_google_docs(
@@ -635,5 +627,4 @@ def export_email_to_google_docs(
     """
     Export an email draft to Google Docs.
     """
-    exporter = GoogleDocsExporter()
-    return exporter.create_email_doc(email_draft, brand_name, folder_id, structure_name, language)
+    return get_docs_exporter().create_email_doc(email_draft, brand_name, folder_id, structure_name, language)
@@ -24,6 +24,7 @@ SCOPES = [
 ]
 
 DEFAULT_CREDENTIALS_PATH = Path(__file__).parent.parent.parent / "google_credentials.json"
+GOOGLE_SHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
 
 class GoogleSheetsExporter:
     """Exports campaign plans to Google Sheets using native API."""
@@ -119,18 +120,8 @@ class GoogleSheetsExporter:
             # FILE NAMING: BRAND-MONTH-CAMPAIGN ID
             sheet_title = f"{brand_name}-{target_month}-{campaign_id}"
             
-            # Create spreadsheet
-            spreadsheet = {'properties': {'title': sheet_title}}
-            spreadsheet = self.sheets_service.spreadsheets().create(
-                body=spreadsheet,
-                fields='spreadsheetId'
-            ).execute()
-            
-            spreadsheet_id = spreadsheet.get('spreadsheetId')
-            
-            # Move to folder if specified
-            if folder_id:
-                self._move_to_folder(spreadsheet_id, folder_id)
+            # Create spreadsheet (directly inside the folder if specified)
+            spreadsheet_id = self._create_spreadsheet(sheet_title, folder_id)
             
             # Populate Data
             self._write_campaign_data(spreadsheet_id, plan_data)
@@ -198,24 +189,28 @@ class GoogleSheetsExporter:
         
         all_values = overview_data + [headers] + email_rows
         
-        # Write Data
-        body = {'values': all_values}
+        # Write Data + Format in ONE batchUpdate (values as RAW strings, like valueInputOption="RAW")
+        write_request = {
+            "updateCells": {
+                "start": {"sheetId": 0, "rowIndex": 0, "columnIndex": 0},
+                "rows": [
+                    {"values": [{"userEnteredValue": {"stringValue": value}} for value in row]}
+                    for row in all_values
+                ],
+                "fields": "userEnteredValue"
+            }
+        }
         
-        self.sheets_service.spreadsheets().values().update(
+        self.sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            range="Sheet1!A1",
-            valueInputOption="RAW",
-            body=body
+            body={"requests": [write_request] + self._format_requests(len(overview_data), len(email_rows))}
         ).execute()
-        
-        # Format
-        self._format_sheet(spreadsheet_id, len(overview_data), len(email_rows))
 
-    def _format_sheet(self, spreadsheet_id: str, overview_rows: int, email_rows: int):
-        """Apply formatting to make it readable."""
+    def _format_requests(self, overview_rows: int, email_rows: int) -> List[Dict[str, Any]]:
+        """Formatting requests to make the sheet readable."""
         header_row_index = overview_rows
         
-        requests = [
+        return [
             # Bold Campaign Summary Title
             {
                 "repeatCell": {
@@ -291,31 +286,43 @@ class GoogleSheetsExporter:
                 }
             }
         ]
+
+    def _create_spreadsheet(self, title: str, folder_id: Optional[str] = None) -> str:
+        """
+        Creates an empty spreadsheet and returns its ID.
+        With a folder, it is created there in one Drive call instead of create + move.
+        If that fails it is created in the Drive root, as a failed move did before.
+        """
+        if folder_id:
+            try:
+                file = self.drive_service.files().create(
+                    body={'name': title, 'mimeType': GOOGLE_SHEET_MIME_TYPE, 'parents': [folder_id]},
+                    fields='id'
+                ).execute()
+                return file.get('id')
+            except Exception as e:
+                print(f"[GoogleSheets] Warning: Could not create sheet in folder: {e}")
         
-        self.sheets_service.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body={"requests": requests}
+        spreadsheet = self.sheets_service.spreadsheets().create(
+            body={'properties': {'title': title}},
+            fields='spreadsheetId'
         ).execute()
+        return spreadsheet.get('spreadsheetId')
 
-    def _move_to_folder(self, file_id: str, folder_id: str):
-        """Move file to specific folder using shared Drive service."""
-        try:
-            file = self.drive_service.files().get(fileId=file_id, fields='parents').execute()
-            previous_parents = ",".join(file.get('parents', []))
-            self.drive_service.files().update(
-                fileId=file_id,
-                addParents=folder_id,
-                removeParents=previous_parents,
-                fields='id, parents'
-            ).execute()
-            print(f"[GoogleSheets] ✓ Moved to folder: {folder_id}")
-        except Exception as e:
-            print(f"[GoogleSheets] Warning: Could not move to folder: {e}")
+# Authenticated once per process: credential probing, token refresh and service discovery
+# only change at deploy time. The services refresh expired tokens on their own.
+_exporter = None
+
+def get_sheets_exporter() -> GoogleSheetsExporter:
+    """Get or create the shared GoogleSheetsExporter"""
+    global _exporter
+    if _exporter is None:
+        _exporter = GoogleSheetsExporter()
+    return _exporter
 
 # Convenience function
 def export_plan_to_google_sheets(
     plan_data: Dict[str, Any],
     folder_id: Optional[str] = None
 ) -> Dict[str, str]:
-    exporter = GoogleSheetsExporter()
-    return exporter.export_plan(plan_data, folder_id)
+    return get_sheets_exporter().export_plan(plan_data, folder_id)
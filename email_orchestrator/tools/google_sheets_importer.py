@@ -166,6 +166,15 @@ class GoogleSheetsImporter:
             "email_slots": email_slots
         }
 
+# Authenticated once per process (see google_sheets_export.get_sheets_exporter)
+_importer = None
+
+def get_sheets_importer() -> GoogleSheetsImporter:
+    """Get or create the shared GoogleSheetsImporter"""
+    global _importer
+    if _importer is None:
+        _importer = GoogleSheetsImporter()
+    return _importer
+
 def import_plan_from_sheet(sheet_url: str) -> Dict[str, Any]:
-    importer = GoogleSheetsImporter()
-    return importer.import_plan(sheet_url)
+    return get_sheets_importer().import_plan(sheet_url)
@@ -1,13 +1,17 @@
 import json
 import os
-from typing import List, Dict, Any
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from email_orchestrator.schemas import CampaignLogEntry
+from email_orchestrator.tools import fast_json
 
 HISTORY_FILE = "email_history_log.json"
 MAX_ENTRIES_PER_BRAND = 50  # Keep last 50 emails per brand
 TOTAL_MAX_ENTRIES = 500  # Hard limit across all brands
+RECENT_CACHE_TTL_SECONDS = 30  # Planning turns query the same brand history several times
 
 class HistoryManager:
     """
@@ -16,6 +20,17 @@ class HistoryManager:
     
     Auto-cleanup: Keeps last 50 emails per brand, max 500 total.
     """
+
+    # Shared across instances (each tool module owns its own HistoryManager) so that
+    # log_campaign on any instance invalidates cached lookups for the same file.
+    # Entries also carry the file's (mtime_ns, size), so writes by another process invalidate them.
+    _recent_cache: Dict[Tuple[str, str, int], Tuple[float, Tuple[int, int], List[CampaignLogEntry], List[Dict[str, Any]]]] = {}
+    # log_campaign is a read-modify-write of the whole file and may run in worker threads;
+    # also guards _recent_cache (re-entrant: log_campaigns_batch clears the cache while holding it)
+    _write_lock = threading.RLock()
+    # Parsed history per file, reused until the file's mtime/size changes (the JSON file is
+    # this manager's "connection": re-reading and re-parsing it is the per-call setup cost).
+    _file_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
     
     def __init__(self, history_file: str = HISTORY_FILE):
         self.history_file = history_file
@@ -26,16 +41,39 @@ class HistoryManager:
             with open(self.history_file, 'w') as f:
                 json.dump([], f)
 
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the history file, or None if it is missing."""
+        try:
+            stat = os.stat(self.history_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load_history(self) -> List[Dict[str, Any]]:
+        """Returns a shallow copy of the parsed history; entries are shared, treat them as read-only."""
+        path = os.path.abspath(self.history_file)
         try:
-            with open(self.history_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = HistoryManager._file_cache.get(path)
+            if cached and cached[0] == signature:
+                return list(cached[1])
+            with open(path, 'rb') as f:
+                history = fast_json.loads(f.read())
+        except (ValueError, FileNotFoundError):  # orjson and json decode errors are both ValueErrors
             return []
+        HistoryManager._file_cache[path] = (signature, history)
+        return list(history)
 
     def _save_history(self, history: List[Dict[str, Any]]):
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        # Write-then-rename so concurrent readers never see a half-written file
+        tmp_file = f"{self.history_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(fast_json.dumps(history, indent=True))
+        os.replace(tmp_file, self.history_file)
+        path = os.path.abspath(self.history_file)
+        stat = os.stat(path)
+        HistoryManager._file_cache[path] = ((stat.st_mtime_ns, stat.st_size), list(history))
 
     def _cleanup_if_needed(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -70,17 +108,32 @@ class HistoryManager:
         return cleaned
 
     def log_campaign(self, entry: CampaignLogEntry):
-        """Append a new campaign entry to the log with auto-cleanup."""
-        history = self._load_history()
-        
-        # Ensure brand_id is present if possible (not strictly required here as it comes from schema)
-        
-        history.append(entry.model_dump())
-        
-        # Auto-cleanup
-        history = self._cleanup_if_needed(history)
-        
-        self._save_history(history)
+        """Append a new campaign entry to the log with auto-cleanup. Thread-safe."""
+        self.log_campaigns_batch([entry])
+
+    def log_campaigns_batch(self, entries: List[CampaignLogEntry]):
+        """Append several entries with a single read-modify-write of the log. Thread-safe."""
+        if not entries:
+            return
+        with HistoryManager._write_lock:
+            history = self._load_history()
+            
+            # Ensure brand_id is present if possible (not strictly required here as it comes from schema)
+            
+            history.extend(entry.model_dump() for entry in entries)
+            
+            # Auto-cleanup
+            history = self._cleanup_if_needed(history)
+            
+            self._save_history(history)
+            self.clear_recent_cache()
+
+    def clear_recent_cache(self):
+        """Drop cached get_recent_campaigns results for this history file."""
+        path = os.path.abspath(self.history_file)
+        with HistoryManager._write_lock:
+            for key in [k for k in HistoryManager._recent_cache if k[0] == path]:
+                del HistoryManager._recent_cache[key]
 
     def get_recent_campaigns(self, brand_identifier: str, limit: int = 10) -> List[CampaignLogEntry]:
         """
@@ -88,9 +141,29 @@ class HistoryManager:
         
         Args:
             brand_identifier: Either brand_id (preferred) or brand_name (legacy).
+        
+        Results are cached for RECENT_CACHE_TTL_SECONDS and invalidated by log_campaign
+        or by any change to the file's mtime/size.
         """
-        all_history = self._load_history()
+        return list(self._get_recent(brand_identifier, limit)[0])
+
+    def get_recent_campaign_dicts(self, brand_identifier: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Same entries as get_recent_campaigns, as model_dump() dicts (for the deterministic verifier).
+        The dicts are dumped once per cache fill and shared: treat them as read-only.
+        """
+        return list(self._get_recent(brand_identifier, limit)[1])
+
+    def _get_recent(self, brand_identifier: str, limit: int) -> Tuple[List[CampaignLogEntry], List[Dict[str, Any]]]:
         brand_identifier = brand_identifier.lower()
+        cache_key = (os.path.abspath(self.history_file), brand_identifier, limit)
+        signature = self._file_signature()
+        with HistoryManager._write_lock:
+            cached = HistoryManager._recent_cache.get(cache_key)
+        if cached and cached[1] == signature and time.monotonic() - cached[0] < RECENT_CACHE_TTL_SECONDS:
+            return cached[2], cached[3]
+
+        all_history = self._load_history()
         
         # Filter logic:
         # A match occurs if:
@@ -110,18 +183,37 @@ class HistoryManager:
         
         recent_dicts = brand_history[-limit:]
         
-        return [CampaignLogEntry(**item) for item in recent_dicts]
+        recent = [CampaignLogEntry(**item) for item in recent_dicts]
+        dumped = [entry.model_dump() for entry in recent]
+        with HistoryManager._write_lock:
+            HistoryManager._recent_cache[cache_key] = (time.monotonic(), signature, recent, dumped)
+        return recent, dumped
+
+    def get_recent_fields(self, brand_identifier: str, limit: int, fields: Tuple[str, ...]) -> Dict[str, List[Any]]:
+        """
+        Collects several CampaignLogEntry fields from the recent campaigns in one pass.
+        Returns {field: [value per entry]} (None where an entry lacks the value).
+        Backed by the get_recent_campaigns TTL cache.
+        """
+        collected: Dict[str, List[Any]] = {field: [] for field in fields}
+        for entry in self.get_recent_campaigns(brand_identifier, limit):
+            for field in fields:
+                collected[field].append(getattr(entry, field, None))
+        return collected
 
     def get_usage_summary(self, brand_name: str, limit: int = 10) -> Dict[str, List[str]]:
         """
         Returns a summary of recently used elements for quick checking.
         """
-        recent = self.get_recent_campaigns(brand_name, limit)
+        recent = self.get_recent_fields(
+            brand_name, limit,
+            ("transformation_id", "structure_id", "angle_id", "offer_placement_used")
+        )
         return {
-            "transformations": [c.transformation_id for c in recent],
-            "structures": [c.structure_id for c in recent],
-            "storytelling_angles": [c.angle_id for c in recent],
-            "offer_placements": [c.offer_placement_used for c in recent],
+            "transformations": recent["transformation_id"],
+            "structures": recent["structure_id"],
+            "storytelling_angles": recent["angle_id"],
+            "offer_placements": recent["offer_placement_used"],
         }
     
     def get_stats(self) -> Dict[str, Any]:
@@ -31,9 +31,7 @@ class KnowledgeReader:
 
         try:
             reader = PdfReader(str(file_path))
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            text = "".join(page.extract_text() + "\n" for page in reader.pages)
             
             self._cache[filename] = text
             return text
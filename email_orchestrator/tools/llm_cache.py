@@ -0,0 +1,72 @@
+"""
+In-process cache for LLM responses whose prompt is fully determined by a small key.
+
+Only use this for calls where returning the same answer again is correct
+(e.g. research lookups about a brand). Creative calls (drafts, blueprints)
+must not be cached: identical copy across campaigns is exactly what the
+repetition checks are there to prevent.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class AsyncResponseCache:
+    """
+    TTL + LRU cache for async calls, keyed by an exact hashable key.
+    Concurrent callers with the same key share one in-flight request.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_call(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] = lambda result: True
+    ) -> Any:
+        """Return the cached result for `key`, or await `call()` and cache it if `cache_if(result)`."""
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        pending = self._in_flight.get(key)
+        if pending:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this caller was cancelled
+                # The leading call was cancelled: make the request ourselves below
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await call()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't warn about an unretrieved exception
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        future.set_result(result)
+        if cache_if(result):
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
@@ -1,4 +1,3 @@
-import json
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
@@ -74,8 +73,7 @@ async def parse_campaign_request(user_input: str) -> CampaignRequest:
         elif "```" in cleaned:
             cleaned = cleaned.split("```")[1].split("```")[0]
             
-        data = json.loads(cleaned)
-        return CampaignRequest(**data)
+        return CampaignRequest.model_validate_json(cleaned)
         
     except Exception as e:
         print(f"[RequestParser] Error: {e}")
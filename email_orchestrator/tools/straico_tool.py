@@ -8,12 +8,83 @@ import aiohttp
 import asyncio
 import random
 import json
+import time
 from pathlib import Path
 
 # Environment variables are loaded by the main orchestrator; no need to load .env here
 
 from email_orchestrator.config import STRAICO_MODEL
 
+MAX_RETRIES = 5
+BASE_DELAY_SECONDS = 2
+MAX_DELAY_SECONDS = 60
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+BREAKER_FAILURE_THRESHOLD = 8  # consecutive retryable failures across all concurrent calls
+BREAKER_COOLDOWN_SECONDS = 30
+
+
+def _backoff_delay(attempt: int, retry_after: str = None) -> float:
+    """Exponential backoff + jitter; a numeric Retry-After header (429) takes precedence."""
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_DELAY_SECONDS)
+        except ValueError:
+            pass
+    return min(BASE_DELAY_SECONDS * (2 ** attempt), MAX_DELAY_SECONDS) + random.random()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling the API while the Straico circuit breaker is open."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after  # seconds until the breaker lets a request through
+
+
+class CircuitBreaker:
+    """
+    Shared by every call of the client, so concurrent slots stop hammering the API during an outage.
+    CLOSED: requests flow; consecutive server/network failures are counted (429s are not:
+    rate limiting is handled by Retry-After backoff, not by failing fast).
+    OPEN: after the threshold, requests fail fast for the cooldown.
+    HALF_OPEN: after the cooldown one trial request goes through; success closes, failure re-opens.
+    Plain state (no asyncio primitives) is enough: it is only touched from the event loop thread.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+
+    def before_request(self):
+        if self.opened_at is None:
+            return
+        now = time.monotonic()
+        remaining = self.cooldown_seconds - (now - self.opened_at)
+        # A trial that never reported back (cancelled, unexpected error) stops blocking after one cooldown
+        trial_pending = self.trial_started_at is not None and now - self.trial_started_at < self.cooldown_seconds
+        if remaining > 0 or trial_pending:
+            wait = remaining if remaining > 0 else self.cooldown_seconds - (now - self.trial_started_at)
+            raise CircuitOpenError(f"Straico circuit open after {self.failures} consecutive failures; retry in {wait:.0f}s", wait)
+        self.trial_started_at = now  # HALF_OPEN
+
+    def record_success(self):
+        if self.opened_at is not None:
+            print("[StraicoAPI] Circuit closed (API responding again).")
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        self.trial_started_at = None
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                print(f"[StraicoAPI] Circuit OPEN after {self.failures} consecutive failures. Failing fast for {self.cooldown_seconds}s.")
+            self.opened_at = time.monotonic()
+
 
 class StraicoAPIClient:
     """Simple client for making Straico API requests"""
@@ -23,11 +94,31 @@ class StraicoAPIClient:
         if not self.api_key:
             raise ValueError("STRAICO_API_KEY not set in environment")
         self.base_url = "https://api.straico.com/v2"
+        self.breaker = CircuitBreaker()
+        # One pooled session per event loop: concurrent slots reuse its TCP/TLS connections
+        self._session: aiohttp.ClientSession = None
+        self._session_loop = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session is bound to the loop it was created on (each asyncio.run gets a new one)
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the pooled session (call before the event loop ends)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
     
     async def generate_text(self, prompt: str, model: str = STRAICO_MODEL) -> str:
         """
         Make a simple text generation request to Straico API.
-        Includes retry logic for server errors (502, 503, 504).
+        Includes retry logic for rate limits (429), server errors (500, 502, 503, 504),
+        network errors and timeouts. Backoff uses asyncio.sleep, so concurrent slots keep running.
         """
         url = f"{self.base_url}/chat/completions"
         headers = {
@@ -44,66 +135,79 @@ class StraicoAPIClient:
         }
         
         timeout = aiohttp.ClientTimeout(total=120)
-        max_retries = 5
-        base_delay = 2
         
-        for attempt in range(max_retries):
+        for attempt in range(MAX_RETRIES):
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.post(url, headers=headers, json=body) as resp:
+                self.breaker.before_request()
+                session = self._get_session()
+                async with session.post(url, headers=headers, json=body, timeout=timeout) as resp:
+                    
+                    # 1. Handle Success
+                    if resp.status == 200:
+                        self.breaker.record_success()
+                        resp_json = await resp.json()
+                        
+                        # Extract text
+                        choices = resp_json.get("choices", [])
+                        if not choices:
+                            return ""
+                        
+                        message = choices[0].get("message", {})
+                        content = message.get("content", "")
                         
-                        # 1. Handle Success
-                        if resp.status == 200:
-                            resp_json = await resp.json()
-                            
-                            # Extract text
-                            choices = resp_json.get("choices", [])
-                            if not choices:
-                                return ""
-                            
-                            message = choices[0].get("message", {})
-                            content = message.get("content", "")
-                            
-                            # Track usage
-                            usage = resp_json.get("usage", {})
-                            prompt_tokens = usage.get("prompt_tokens", 0)
-                            completion_tokens = usage.get("completion_tokens", 0)
-                            
-                            if prompt_tokens > 0:
-                                from email_orchestrator.tools.token_tracker import get_token_tracker
-                                get_token_tracker().log_usage("StraicoAPI", prompt_tokens, completion_tokens)
-                            
-                            return content
-
-                        # 2. Handle Retryable Server Errors
-                        elif resp.status in [502, 503, 504]:
-                            error_text = await resp.text()
-                            print(f"[StraicoAPI] Server Error {resp.status} on attempt {attempt+1}/{max_retries}. Retrying...")
-                            
-                            if attempt < max_retries - 1:
-                                # Exponential backoff + jitter
-                                delay = (base_delay * (2 ** attempt)) + (random.random() * 1.0)
-                                print(f"[StraicoAPI] Waiting {delay:.2f}s...")
-                                await asyncio.sleep(delay)
-                                continue
-                            else:
-                                raise RuntimeError(f"Straico API failed after {max_retries} retries. Last code: {resp.status}. Error: {error_text}")
-
-                        # 3. Handle Non-Retryable Client Errors (400, 401, etc.)
+                        # Track usage
+                        usage = resp_json.get("usage", {})
+                        prompt_tokens = usage.get("prompt_tokens", 0)
+                        completion_tokens = usage.get("completion_tokens", 0)
+                        
+                        if prompt_tokens > 0:
+                            from email_orchestrator.tools.token_tracker import get_token_tracker
+                            get_token_tracker().log_usage("StraicoAPI", prompt_tokens, completion_tokens)
+                        
+                        return content
+
+                    # 2. Handle Retryable Errors (rate limit + server errors)
+                    elif resp.status in RETRYABLE_STATUSES:
+                        if resp.status == 429:
+                            self.breaker.record_success()  # the API is up, just throttling us
                         else:
-                            error_text = await resp.text()
-                            raise RuntimeError(f"Straico API Client Error {resp.status}: {error_text}")
-                            
-            except aiohttp.ClientError as e:
-                # Network level errors (connection refused, etc.) are also retryable
-                print(f"[StraicoAPI] Network Error on attempt {attempt+1}/{max_retries}: {e}")
-                if attempt < max_retries - 1:
-                    delay = (base_delay * (2 ** attempt)) + (random.random() * 1.0)
+                            self.breaker.record_failure()
+                        error_text = await resp.text()
+                        print(f"[StraicoAPI] Error {resp.status} on attempt {attempt+1}/{MAX_RETRIES}. Retrying...")
+                        
+                        if attempt < MAX_RETRIES - 1:
+                            delay = _backoff_delay(attempt, resp.headers.get("Retry-After"))
+                            print(f"[StraicoAPI] Waiting {delay:.2f}s...")
+                            await asyncio.sleep(delay)
+                            continue
+                        else:
+                            raise RuntimeError(f"Straico API failed after {MAX_RETRIES} retries. Last code: {resp.status}. Error: {error_text}")
+
+                    # 3. Handle Non-Retryable Client Errors (400, 401, etc.)
+                    else:
+                        self.breaker.record_success()  # the API is up; the request itself is bad
+                        error_text = await resp.text()
+                        raise RuntimeError(f"Straico API Client Error {resp.status}: {error_text}")
+                        
+            except CircuitOpenError as e:
+                # The API is down for everyone: wait out the cooldown instead of failing this call
+                print(f"[StraicoAPI] {e} (attempt {attempt+1}/{MAX_RETRIES})")
+                if attempt < MAX_RETRIES - 1:
+                    await asyncio.sleep(e.retry_after + random.random())
+                    continue
+                raise
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Network level errors (connection refused, etc.) and timeouts are also retryable
+                self.breaker.record_failure()
+                print(f"[StraicoAPI] Network Error on attempt {attempt+1}/{MAX_RETRIES}: {e!r}")
+                if attempt < MAX_RETRIES - 1:
+                    delay = _backoff_delay(attempt)
                     print(f"[StraicoAPI] Waiting {delay:.2f}s...")
                     await asyncio.sleep(delay)
                     continue
                 else:
-                    print(f"[StraicoAPIClient] Final Network Error: {e}")
+                    print(f"[StraicoAPIClient] Final Network Error: {e!r}")
                     raise e
                     
             except Exception as e:
@@ -125,6 +229,12 @@ def get_client() -> StraicoAPIClient:
     return _client
 
 
+async def close_client():
+    """Close the shared client's pooled HTTP session, if one was opened."""
+    if _client is not None:
+        await _client.close()
+
+
 # ============================================================================
 # TOOL FUNCTIONS - These are registered with the Gemini orchestrator
 # ============================================================================
@@ -25,6 +25,7 @@ class TokenTracker:
         self.usage_log: List[Dict[str, Any]] = []
         self.totals = defaultdict(int) # total_prompt, total_completion, total_all
         self.by_agent = defaultdict(lambda: defaultdict(int)) # agent -> {prompt, completion, total}
+        self.speculation = defaultdict(lambda: defaultdict(int)) # kind -> {hit, cancelled}
         
     def log_usage(self, agent_name: str, prompt_tokens: int, completion_tokens: int):
         """Log a single API call's usage."""
@@ -48,6 +49,10 @@ class TokenTracker:
         self.by_agent[agent_name]["completion"] += completion_tokens
         self.by_agent[agent_name]["total"] += total
 
+    def log_speculation(self, kind: str, hit: bool):
+        """Record whether a speculatively started call was used or cancelled."""
+        self.speculation[kind]["hit" if hit else "cancelled"] += 1
+
     def get_summary(self) -> str:
         """Generate a formatted summary string."""
         if self.totals["all"] == 0:
@@ -62,6 +67,9 @@ class TokenTracker:
         
         for agent, stats in sorted_agents:
             lines.append(f"{agent:<20}: {stats['total']:,} ({stats['prompt']:,} in / {stats['completion']:,} out)")
+        
+        for kind, stats in self.speculation.items():
+            lines.append(f"speculative {kind:<8}: {stats['hit']} used / {stats['cancelled']} cancelled")
             
         lines.append("==========================\n")
         return "\n".join(lines)
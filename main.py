@@ -63,7 +63,7 @@ async def run_execute(args):
     print("=== CAMPAIGN ORCHESTRATOR: PHASE 2 (EXECUTION) ===")
     
     manager = CampaignPlanManager()
-    plan = manager.get_plan(args.campaign_id)
+    plan = await asyncio.to_thread(manager.get_plan, args.campaign_id)
     
     if not plan:
         print(f"Error: Campaign Plan {args.campaign_id} not found.")
@@ -74,13 +74,13 @@ async def run_execute(args):
         print(f"\n[Sync] Found linked Google Sheet: {plan.sheet_url}")
         print("[Sync] Importing user edits...")
         try:
-            imported_data = import_plan_from_sheet(plan.sheet_url)
+            imported_data = await asyncio.to_thread(import_plan_from_sheet, plan.sheet_url)
             # Ensure we are updating the correct campaign
             if imported_data.get('campaign_id') and imported_data['campaign_id'] != args.campaign_id:
                 print(f"[Warning] Mismatch ID in sheet ({imported_data['campaign_id']}) vs argument ({args.campaign_id}). Proceeding with argument ID.")
                 imported_data['campaign_id'] = args.campaign_id
                 
-            manager.update_plan_from_import(imported_data)
+            await asyncio.to_thread(manager.update_plan_from_import, imported_data)
         except Exception as e:
             print(f"[Sync] Failed to sync from sheet: {e}")
             print("[Sync] Proceeding with existing internal plan...")
@@ -115,7 +115,8 @@ async def run_execute(args):
         drafts_dir = Path(f"outputs/drafts/{args.campaign_id}")
         drafts_dir.mkdir(parents=True, exist_ok=True)
         draft_file = drafts_dir / f"drafts_{timestamp}.json"
-        draft_file.write_text(json.dumps(drafts, indent=2))
+        # json_result is already the indented JSON of these drafts: write it as-is
+        draft_file.write_text(json_result, encoding="utf-8")
         print(f"[Safety] Drafts saved to {draft_file}")
         
         # ROTATION: Keep last 5
@@ -152,7 +153,8 @@ async def run_execute(args):
         except: 
             pass
             
-        doc_url = compile_campaign_doc(
+        doc_url = await asyncio.to_thread(
+            compile_campaign_doc,
             brand_name=plan.brand_name,
             campaign_id=plan.campaign_id,
             target_month=target_month,
@@ -169,6 +171,14 @@ async def run_execute(args):
         print(f"[Execution] Error processing results: {e}")
 
 
+async def _run_and_close(coro):
+    """Runs a phase, then closes the pooled Straico HTTP session before the loop ends."""
+    from email_orchestrator.tools.straico_tool import close_client
+    try:
+        return await coro
+    finally:
+        await close_client()
+
 def main():
     parser = argparse.ArgumentParser(description="AI Email Campaign Orchestrator")
     subparsers = parser.add_subparsers(dest='command', help='Phase to run')
@@ -188,9 +198,9 @@ def main():
     args = parser.parse_args()
     
     if args.command == 'plan':
-        asyncio.run(run_plan(args))
+        asyncio.run(_run_and_close(run_plan(args)))
     elif args.command == 'execute':
-        asyncio.run(run_execute(args))
+        asyncio.run(_run_and_close(run_execute(args)))
     else:
         parser.print_help()
 
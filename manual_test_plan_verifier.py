@@ -1,6 +1,6 @@
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from email_orchestrator.tools.deterministic_verifier import DeterministicVerifier
 from email_orchestrator.schemas import CampaignPlan, EmailSlot
 
@@ -18,7 +18,7 @@ MOCK_PLAN = CampaignPlan(
     total_emails=3,
     overarching_narrative="From post-Christmas recovery to New Year glam.",
     promotional_balance="70% promotional, 30% educational",
-    created_at=datetime.utcnow().isoformat(),
+    created_at=datetime.now(timezone.utc).isoformat(),
     
     # --------------------------------------------------------------------------
     # 👇 EDIT THESE SLOTS TO TRIGGER REPETITION ERRORS